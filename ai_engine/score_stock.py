@@ -14,283 +14,886 @@ Features:
 Author: Drovalix AI Team
 """
 
-import yfinance as yf
+import numpy as np
+import os
 import sys
 import json
 import csv
 import argparse
 import logging
+import asyncio
+import platform
+import time
+import bisect
+import math
+import hashlib
+import sqlite3
+import shutil
+import tempfile
+import functools
+import operator
 import concurrent.futures
-from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime
+import contextlib
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple, FrozenSet, Iterable, Iterator, ClassVar, IO, Callable, NamedTuple
+from datetime import datetime, timezone
 
 try:
     from prettytable import PrettyTable
 except ImportError:
     PrettyTable = None
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # enables HTTP/2 in httpx
+except ImportError:
+    h2 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uringcore
+except ImportError:
+    uringcore = None
+
 # =========================
 # Logging Configuration
 # =========================
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s %(levelname)s %(name)s: %(message)s',
-    handlers=[logging.StreamHandler(sys.stdout)]
+    # stderr: stdout carries the streamed JSON/NDJSON/CSV results.
+    handlers=[logging.StreamHandler(sys.stderr)]
 )
 logger = logging.getLogger("DrovalixScoreEngine")
+# Quiet by default: per-ticker messages are only formatted with -v/--debug.
+logger.setLevel(logging.WARNING)
+
+# =========================
+# Data Fetching
+# =========================
+
+def _yf():
+    """Import yfinance on first use; with pandas it is most of the CLI's start-up time."""
+    import yfinance
+    return yfinance
+
+@functools.lru_cache(maxsize=128)
+def _ticker(ticker: str):
+    """One yf.Ticker per symbol, shared by the info and history lookups (it caches its own session state)."""
+    return _yf().Ticker(ticker)
+
+# .info fields that Ticker.fast_info can serve without the slow quoteSummary scrape.
+FAST_INFO_FIELDS = {
+    "marketCap": "market_cap",
+    "currentPrice": "last_price",
+    "previousClose": "previous_close",
+    "sharesOutstanding": "shares",
+    "fiftyDayAverage": "fifty_day_average",
+    "twoHundredDayAverage": "two_hundred_day_average",
+    "averageDailyVolume10Day": "ten_day_average_volume",
+    "currency": "currency",
+}
+
+# Direct Yahoo quoteSummary access (the endpoint yfinance scrapes for .info).
+QUOTE_SUMMARY_URL = "https://query2.finance.yahoo.com/v10/finance/quoteSummary/{ticker}"
+YAHOO_COOKIE_URL = "https://fc.yahoo.com"
+YAHOO_CRUMB_URL = "https://query1.finance.yahoo.com/v1/test/getcrumb"
+QUOTE_SUMMARY_MODULES = ("financialData", "quoteType", "defaultKeyStatistics", "assetProfile", "summaryDetail")
+
+# quoteSummary module serving each .info field. Fields Yahoo does not publish
+# are listed in UNPUBLISHED_INFO_FIELDS instead and never requested.
+QUOTE_SUMMARY_FIELD_MODULES = {
+    "currentPrice": "financialData",
+    "returnOnEquity": "financialData",
+    "returnOnAssets": "financialData",
+    "debtToEquity": "financialData",
+    "currentRatio": "financialData",
+    "quickRatio": "financialData",
+    "profitMargins": "financialData",
+    "operatingMargins": "financialData",
+    "freeCashflow": "financialData",
+    "revenueGrowth": "financialData",
+    "totalRevenue": "financialData",
+    "recommendationKey": "financialData",
+    "earningsQuarterlyGrowth": "defaultKeyStatistics",
+    "pegRatio": "defaultKeyStatistics",
+    "priceToBook": "defaultKeyStatistics",
+    "trailingEps": "defaultKeyStatistics",
+    "bookValue": "defaultKeyStatistics",
+    "shortPercentOfFloat": "defaultKeyStatistics",
+    "heldPercentInsiders": "defaultKeyStatistics",
+    "heldPercentInstitutions": "defaultKeyStatistics",
+    "trailingPE": "summaryDetail",
+    "priceToSalesTrailing12Months": "summaryDetail",
+    "marketCap": "summaryDetail",
+    "dividendYield": "summaryDetail",
+    "payoutRatio": "summaryDetail",
+    "beta": "summaryDetail",
+    "averageDailyVolume10Day": "summaryDetail",
+    "sector": "assetProfile",
+    "industry": "assetProfile",
+    "shortName": "price",
+    "esgScores": "esgScores",
+}
+# Fields the default metrics read that neither quoteSummary nor yfinance's .info carries;
+# they score "not available" either way, so they do not force the yfinance path.
+UNPUBLISHED_INFO_FIELDS = frozenset({
+    "dividendGrowth", "ebit", "fiveYearAvgRevenueGrowth", "interestExpense", "ipoYear",
+    "retainedEarnings", "returnOnInvestedCapital", "startDate", "totalAssets",
+    "totalCurrentAssets", "totalCurrentLiabilities", "totalLiab",
+})
+# Modules kept as a nested dict under their own name rather than flattened into info.
+NESTED_MODULES = frozenset({"esgScores"})
+# Fields copied into every score result alongside the metrics.
+RESULT_INFO_FIELDS = ("sector", "industry", "shortName")
+
+def quote_summary_modules(keys: Iterable[str]) -> Tuple[str, ...]:
+    """The minimal set of quoteSummary modules covering the given .info fields."""
+    modules = {QUOTE_SUMMARY_FIELD_MODULES[k] for k in keys if k in QUOTE_SUMMARY_FIELD_MODULES}
+    return tuple(sorted(modules))
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+}
+HTTP_TIMEOUT = 15.0
+CONCURRENCY_LIMIT = 16
+# One pooled client per batch; keep-alive connections are reused across tickers.
+HTTP_MAX_CONNECTIONS = 64
+HTTP_MAX_KEEPALIVE = 32
+# Yahoo throttles with 429; retry with exponential backoff (or its Retry-After).
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF = 0.5
+# Longest 429 wait taken while holding a fetch slot; a longer Retry-After hands the ticker to yfinance.
+HTTP_MAX_RETRY_DELAY = 8 * HTTP_BACKOFF
+
+# On-disk caches: fetched info dicts (JSON, one file per ticker, fresh for INFO_CACHE_TTL seconds),
+# close histories (.npy, one file per UTC date and ticker) and scored results (sqlite).
+CACHE_DIR = os.environ.get("DROVALIX_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "drovalix"))
+INFO_CACHE_TTL = 24 * 60 * 60
+# False bypasses every on-disk cache, for both reads and writes (--no-cache).
+DISK_CACHE = True
+
+# First and last close of the period as a float64 pair (empty when there is no history),
+# keyed by (ticker, UTC date) and filled by prefetch_history().
+_PRICE_CACHE: Dict[Tuple[str, int], np.ndarray] = {}
+
+def _utc_date() -> int:
+    """Today's UTC date as an int YYYYMMDD, the key for all per-day caches."""
+    today = datetime.now(timezone.utc)
+    return today.year * 10000 + today.month * 100 + today.day
+
+# (year, epoch second at which it ends) for _today_year().
+_YEAR_CACHE: Tuple[int, float] = (0, 0.0)
+
+def _today_year() -> int:
+    """Current UTC year, recomputed only once the cached one has rolled over."""
+    global _YEAR_CACHE
+    year, expires = _YEAR_CACHE
+    if time.time() >= expires:
+        year = datetime.now(timezone.utc).year
+        _YEAR_CACHE = (year, datetime(year + 1, 1, 1, tzinfo=timezone.utc).timestamp())
+    return year
+
+def _utc_timestamp() -> str:
+    """ISO-8601 UTC time with a trailing Z, as stamped on results."""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+def _date_iso(date: int) -> str:
+    year, month_day = divmod(date, 10000)
+    month, day = divmod(month_day, 100)
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+@contextlib.contextmanager
+def _atomic_file(path: str) -> Iterator[IO[bytes]]:
+    """Write to a temp file beside path and os.replace() it in, so readers never see a partial file."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+def _cache_name(ticker: str) -> str:
+    # Tickers come straight from the command line or a file; hashing keeps "../x" or "a/b"
+    # from naming a path outside CACHE_DIR.
+    return hashlib.md5(ticker.encode("utf-8")).hexdigest()
+
+def _info_cache_path(ticker: str, modules: Optional[Tuple[str, ...]] = None) -> str:
+    # Direct fetches only hold their quoteSummary modules, so each module set gets its own
+    # directory; "full" holds complete yfinance .info dicts.
+    return os.path.join(CACHE_DIR, "info", "+".join(modules) if modules else "full", f"{_cache_name(ticker)}.json")
+
+def read_cached_info(ticker: str, modules: Optional[Tuple[str, ...]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Return the info dict cached on disk for ticker if it is younger than INFO_CACHE_TTL seconds.
+    modules selects a direct quoteSummary fetch of those modules; None is the full yfinance .info.
+    """
+    if not DISK_CACHE:
+        return None
+    path = _info_cache_path(ticker, modules)
+    try:
+        if time.time() - os.path.getmtime(path) >= INFO_CACHE_TTL:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_cached_info(ticker: str, info: Dict[str, Any], modules: Optional[Tuple[str, ...]] = None) -> None:
+    """Persist an info dict so later runs within INFO_CACHE_TTL skip the network."""
+    if not DISK_CACHE:
+        return
+    try:
+        with _atomic_file(_info_cache_path(ticker, modules)) as f:
+            f.write(json.dumps(info, separators=(",", ":"), default=str).encode("utf-8"))
+    except OSError as e:
+        logger.warning("Could not write info cache for %s: %s", ticker, e)
+
+def _score_cache() -> sqlite3.Connection:
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    conn = sqlite3.connect(os.path.join(CACHE_DIR, "scores.sqlite"), timeout=5.0)
+    # Version 1 added the write time; older tables are only a cache, so they are rebuilt.
+    if conn.execute("PRAGMA user_version").fetchone()[0] < 1:
+        with conn:
+            conn.execute("DROP TABLE IF EXISTS scores")
+            conn.execute(
+                "CREATE TABLE scores (symbol TEXT, date INTEGER, metrics TEXT, result TEXT, written REAL, "
+                "PRIMARY KEY (symbol, date, metrics))"
+            )
+            conn.execute("PRAGMA user_version = 1")
+    return conn
+
+def read_cached_score(ticker: str, date: int, metrics_key: str) -> Optional[Dict[str, Any]]:
+    """
+    Return a result scored earlier on this UTC date with the same metric set, if any,
+    and written less than INFO_CACHE_TTL seconds ago like the info it was scored from.
+    """
+    if not DISK_CACHE:
+        return None
+    try:
+        with contextlib.closing(_score_cache()) as conn:
+            row = conn.execute(
+                "SELECT result FROM scores WHERE symbol = ? AND date = ? AND metrics = ? AND written > ?",
+                (ticker, date, metrics_key, time.time() - INFO_CACHE_TTL),
+            ).fetchone()
+        if not row:
+            return None
+        result = json.loads(row[0])
+        result["metrics"] = [MetricResult(**m) for m in result.get("metrics", ())]
+        return result
+    except (sqlite3.Error, OSError, ValueError, TypeError):
+        return None
+
+def write_cached_score(ticker: str, date: int, metrics_key: str, result: Dict[str, Any]) -> None:
+    if not DISK_CACHE:
+        return
+    try:
+        with contextlib.closing(_score_cache()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO scores VALUES (?, ?, ?, ?, ?)",
+                (ticker, date, metrics_key, json.dumps(result, separators=(",", ":"), default=_json_default),
+                 time.time()),
+            )
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("Could not write score cache for %s: %s", ticker, e)
+
+@functools.lru_cache(maxsize=4096)
+def _load_info(ticker: str, date: int, required_keys: FrozenSet[str]) -> Dict[str, Any]:
+    if required_keys and required_keys.issubset(FAST_INFO_FIELDS):
+        fast = _ticker(ticker).fast_info
+        info = {}
+        for key in required_keys:
+            try:
+                info[key] = getattr(fast, FAST_INFO_FIELDS[key])
+            except Exception:
+                info[key] = None
+        return info
+    info = read_cached_info(ticker)
+    if info is None:
+        info = _ticker(ticker).info
+        write_cached_info(ticker, info)
+    return info
+
+def load_info(ticker: str, required_keys: Iterable[str] = ()) -> Dict[str, Any]:
+    """
+    Fetch the info fields needed for scoring, cached per (ticker, UTC date) in memory and for
+    INFO_CACHE_TTL seconds on disk.
+    Uses Ticker.fast_info when it covers every required key, falling back to the full .info scrape.
+    """
+    return _load_info(ticker, _utc_date(), frozenset(required_keys))
+
+def _parse_quote_summary(raw: bytes) -> Dict[str, Any]:
+    """Flatten a raw quoteSummary response body into an .info-shaped dict of raw values, in one pass."""
+    payload = orjson.loads(raw) if orjson else json.loads(raw)
+    result = payload["quoteSummary"]["result"][0]
+    info: Dict[str, Any] = {}
+    for name, module in result.items():
+        if not isinstance(module, dict):
+            continue
+        target = info.setdefault(name, {}) if name in NESTED_MODULES else info
+        for key, value in module.items():
+            if isinstance(value, dict):
+                if "raw" in value:
+                    value = value["raw"]
+                elif not value:
+                    continue
+            target[key] = value
+    return info
+
+async def _yahoo_crumb(client) -> Optional[str]:
+    try:
+        await client.get(YAHOO_COOKIE_URL)
+        response = await client.get(YAHOO_CRUMB_URL)
+        crumb = response.text.strip()
+        if response.status_code == 200 and crumb and "<" not in crumb:
+            return crumb
+    except httpx.HTTPError as e:
+        logger.warning("Could not obtain Yahoo crumb: %s", e)
+    return None
+
+def _retry_delay(response, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying a 429, or None if that would exceed HTTP_MAX_RETRY_DELAY."""
+    retry_after = response.headers.get("Retry-After", "")
+    delay = float(retry_after) if retry_after.isdigit() else HTTP_BACKOFF * 2 ** attempt
+    return delay if delay <= HTTP_MAX_RETRY_DELAY else None
+
+async def fetch_info(client, semaphore: asyncio.Semaphore, ticker: str, crumb: Optional[str] = None,
+                     modules: Iterable[str] = QUOTE_SUMMARY_MODULES) -> Optional[Dict[str, Any]]:
+    """Fetch one ticker's quoteSummary, returning None so callers can fall back to yfinance."""
+    params = {"modules": ",".join(modules)}
+    if crumb:
+        params["crumb"] = crumb
+    async with semaphore:
+        try:
+            for attempt in range(HTTP_MAX_RETRIES + 1):
+                response = await client.get(QUOTE_SUMMARY_URL.format(ticker=ticker), params=params)
+                if response.status_code != 429 or attempt == HTTP_MAX_RETRIES:
+                    break
+                delay = _retry_delay(response, attempt)
+                if delay is None:
+                    logger.warning("quoteSummary for %s throttled (Retry-After %s); leaving it to yfinance",
+                                   ticker, response.headers.get("Retry-After"))
+                    return None
+                await asyncio.sleep(delay)
+            response.raise_for_status()
+            return _parse_quote_summary(response.content)
+        except Exception as e:
+            logger.warning("quoteSummary fetch failed for %s: %s", ticker, e)
+            return None
+
+async def _fetch_info_each(tickers: List[str], modules: Tuple[str, ...], concurrency: int,
+                           emit: Callable[[Tuple[str, Optional[Dict[str, Any]]]], None]) -> None:
+    """Fetch every ticker on one client, emitting (ticker, info) pairs in completion order."""
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=max(HTTP_MAX_CONNECTIONS, concurrency),
+                          max_keepalive_connections=HTTP_MAX_KEEPALIVE)
+    async with httpx.AsyncClient(headers=HTTP_HEADERS, timeout=HTTP_TIMEOUT, follow_redirects=True,
+                                 limits=limits, http2=h2 is not None) as client:
+        crumb = await _yahoo_crumb(client)
+
+        async def one(ticker: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+            return ticker, await fetch_info(client, semaphore, ticker, crumb, modules)
+
+        for done in asyncio.as_completed([one(t) for t in tickers]):
+            emit(await done)
+
+# Marks the end of a fetch thread's output in iter_info_batch.
+_FETCH_DONE = object()
+
+def iter_info_batch(tickers: List[str], modules: Tuple[str, ...] = QUOTE_SUMMARY_MODULES,
+                    concurrency: int = CONCURRENCY_LIMIT) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+    """
+    Start fetching every ticker now and return an iterator of (ticker, info) pairs in the order
+    the fetches complete; info is None when one failed (for all of them when httpx is
+    unavailable). The event loop runs on a helper thread, so the caller can score and write
+    each info while the rest are still in flight.
+    """
+    landed: "queue.Queue[Any]" = queue.Queue()
+    if httpx is None or not tickers:
+        landed.put(_FETCH_DONE)
+    else:
+        def run():
+            try:
+                asyncio.run(_fetch_info_each(tickers, modules, concurrency, landed.put))
+            except Exception as e:
+                logger.warning("Async info fetch failed, falling back to yfinance: %s", e)
+            finally:
+                landed.put(_FETCH_DONE)
+
+        threading.Thread(target=run, name="quote-summary-fetch", daemon=True).start()
+    return _drain_fetches(landed, tickers)
+
+def _drain_fetches(landed: "queue.Queue[Any]", tickers: List[str]) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+    delivered = set()
+    while True:
+        item = landed.get()
+        if item is _FETCH_DONE:
+            break
+        delivered.add(item[0])
+        yield item
+    for t in tickers:
+        if t not in delivered:
+            yield t, None
+
+def fetch_info_batch(tickers: List[str], modules: Tuple[str, ...] = QUOTE_SUMMARY_MODULES,
+                     concurrency: int = CONCURRENCY_LIMIT) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Fetch info for every ticker concurrently on a single event loop; None marks a failed ticker."""
+    return dict(iter_info_batch(tickers, modules, concurrency))
+
+def _history_cache_path(ticker: str, date: int) -> str:
+    return os.path.join(CACHE_DIR, "history", _date_iso(date), f"{_cache_name(ticker)}.npy")
+
+def _load_cached_history(ticker: str, date: int) -> Optional[np.ndarray]:
+    """Load close anchors saved earlier on the same UTC date into _PRICE_CACHE."""
+    if not DISK_CACHE:
+        return None
+    try:
+        closes = np.load(_history_cache_path(ticker, date))
+    except (OSError, ValueError):
+        return None
+    _PRICE_CACHE[(ticker, date)] = closes
+    return closes
+
+def _cache_history(ticker: str, date: int, closes: np.ndarray) -> None:
+    _PRICE_CACHE[(ticker, date)] = closes
+    if not DISK_CACHE:
+        return
+    try:
+        with _atomic_file(_history_cache_path(ticker, date)) as f:
+            np.save(f, closes)
+    except OSError as e:
+        logger.warning("Could not write history cache for %s: %s", ticker, e)
+
+def prefetch_history(tickers: List[str], period: str = "1y") -> None:
+    """Download closing prices for all tickers not cached today in one pooled yf.download call."""
+    date = _utc_date()
+    missing = [t for t in tickers if (t, date) not in _PRICE_CACHE and _load_cached_history(t, date) is None]
+    if not missing:
+        return
+    try:
+        frame = _yf().download(" ".join(missing), period=period, group_by="ticker", threads=True, progress=False)
+    except Exception as e:
+        logger.warning("Batched history download failed: %s", e)
+        return
+    if frame is None or frame.empty:
+        return
+    if frame.columns.nlevels > 1:
+        closes = frame.xs("Close", axis=1, level=1)
+    else:
+        closes = frame[["Close"]].set_axis(missing[:1], axis=1)
+    matrix = closes.to_numpy(dtype=np.float64)
+    valid = np.isfinite(matrix)
+    for j, t in enumerate(closes.columns):
+        # A ticker that failed inside the batch comes back all-NaN; leave it uncached so
+        # get_close_anchors retries it on its own instead of reporting no history all day.
+        if valid[:, j].any():
+            _cache_history(t, date, _close_anchors(matrix[valid[:, j], j]))
+
+def _close_anchors(closes: np.ndarray) -> np.ndarray:
+    return closes[[0, -1]] if closes.size else np.empty(0, dtype=np.float64)
+
+def get_close_anchors(ticker: str, period: str = "1y") -> np.ndarray:
+    """First and last close of the period, from the in-memory or disk cache when fetched earlier today."""
+    date = _utc_date()
+    closes = _PRICE_CACHE.get((ticker, date))
+    if closes is None:
+        closes = _load_cached_history(ticker, date)
+    if closes is None:
+        closes = _ticker(ticker).history(period=period)["Close"].to_numpy(dtype=np.float64)
+        closes = _close_anchors(closes[np.isfinite(closes)])
+        _cache_history(ticker, date, closes)
+    return closes
+
+def clear_caches() -> None:
+    """
+    Drop the module-level memos and the on-disk info, history and score caches under CACHE_DIR.
+    A scorer's own memo of fetched results is reset by its compile().
+    """
+    _ticker.cache_clear()
+    _load_info.cache_clear()
+    _PRICE_CACHE.clear()
+    for name in ("info", "history"):
+        shutil.rmtree(os.path.join(CACHE_DIR, name), ignore_errors=True)
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(os.path.join(CACHE_DIR, "scores.sqlite"))
 
 # =========================
 # Metric Base Class
 # =========================
+@dataclass(slots=True)
+class MetricResult:
+    """
+    One metric's entry in a result's breakdown; orjson writes it as a JSON object without conversion.
+    Not frozen: a frozen dataclass __init__ costs several times a dict display, once per metric per ticker.
+    """
+    metric: str
+    score: int
+    max: int
+    explanation: List[str]
+
+def _json_default(o: Any) -> Any:
+    # Stdlib json fallback for MetricResult; anything else unknown is written as its string.
+    if isinstance(o, MetricResult):
+        return {"metric": o.metric, "score": o.score, "max": o.max, "explanation": o.explanation}
+    return str(o)
+
+@dataclass(frozen=True, slots=True)
 class StockMetric:
+    """
+    Base class for scoring metrics. Subclasses are frozen, slotted dataclasses too:
+    decorate them with @dataclass(frozen=True, slots=True) and annotate overridden fields.
+    """
     name: str = "GenericMetric"
     max_points: int = 0
     description: str = ""
     weight: float = 1.0
-
-    def score(self, info: Dict[str, Any]) -> Tuple[int, List[str]]:
-        raise NotImplementedError("score() must be implemented in subclasses.")
+    uses_price_history: bool = False
+    # info fields read by score(), in the order their values are passed in.
+    keys: ClassVar[Tuple[str, ...]] = ()
+    # When True, score() is skipped if any key is None and the metric's all-None result is used.
+    all_keys_required: ClassVar[bool] = True
+    # Single-key threshold metrics whose score() is "missing -> 0 points, else thresholds lookup"
+    # set vectorizable so score_vec() bisects a whole column; positive_only also treats <= 0 as missing.
+    vectorizable: ClassVar[bool] = False
+    positive_only: ClassVar[bool] = False
+    # Threshold table read by score_vec() and by the base score() of single-key metrics.
+    thresholds: ClassVar[Optional["ScoreTable"]] = None
+    # Reason given by the base score() when the value is missing (or not positive, for positive_only).
+    missing_reason: ClassVar[str] = ""
+
+    def __post_init__(self):
+        if "__dataclass_fields__" not in type(self).__dict__:
+            raise TypeError(f"{type(self).__name__} must be declared with @dataclass(frozen=True, slots=True)")
+
+    def score(self, values: Tuple[Any, ...]) -> Tuple[int, List[str]]:
+        """
+        Score from the values of self.keys (None where a field is missing). The base implementation
+        covers single-key metrics with thresholds and a missing_reason; others must override it.
+        """
+        if self.thresholds is None or not self.missing_reason or len(self.keys) != 1:
+            raise NotImplementedError("score() must be implemented in subclasses.")
+        (value,) = values
+        if value is None or (self.positive_only and not value > 0):
+            return 0, [self.missing_reason]
+        return _score_table(value, self.thresholds)
 
     def explain(self) -> str:
         return self.description
 
     def required_keys(self) -> List[str]:
-        return []
+        return list(self.keys)
+
+    def score_vec(self, columns: Tuple[np.ndarray, ...], size: int) -> np.ndarray:
+        """Points for `size` tickers at once, from one object array per key in self.keys."""
+        if self.vectorizable:
+            try:
+                values = _float_column(columns[0])
+            except (TypeError, ValueError):
+                pass
+            else:
+                valid = values > 0 if self.positive_only else ~np.isnan(values)
+                return np.where(valid, _score_table_vec(values, self.thresholds), 0).astype(np.int16)
+        if not columns:
+            return np.full(size, self.score(())[0], dtype=np.int16)
+        return np.fromiter((self.score(values)[0] for values in zip(*columns)), dtype=np.int16, count=size)
+
+class ScoreTable(NamedTuple):
+    """Threshold table built by score_table()."""
+    cutoffs: Tuple[float, ...]  # ascending
+    buckets: Tuple[Tuple[int, str], ...]  # (points, reason template) per bucket
+    find: Any  # bisect function giving the bucket index
+    scale: float
+    nan_bucket: int
+    shown: Any  # display conversion or None
+
+# Display conversions for score_table(shown=...); partials keep the table repr stable for metrics_key.
+AS_PERCENT = functools.partial(operator.mul, 100)  # "%.2f%%" % (v * 100) == "{:.2%}".format(v)
+WITH_COMMAS = functools.partial(str.format, "{:,}")
+
+def score_table(rows: Iterable[Tuple[float, int, str]], otherwise: Tuple[int, str],
+                op: str = ">", scale: float = 1, shown: Any = None) -> ScoreTable:
+    """
+    Build a lookup table replacing an if/elif threshold ladder. rows are (cutoff, points,
+    reason template) with the best bucket first, matched as `value op cutoff` for op ">",
+    ">=" or "<"; everything else (NaN included) gets `otherwise`. Values are multiplied by
+    scale before matching and are %-formatted into the template, through shown(value)
+    when a display conversion is given.
+    """
+    rows = tuple(rows)
+    if op == "<":
+        cutoffs = tuple(row[0] for row in rows)
+        buckets = tuple(row[1:] for row in rows) + (otherwise,)
+        return ScoreTable(cutoffs, buckets, bisect.bisect_right, scale, len(cutoffs), shown)
+    if op not in (">", ">="):
+        raise ValueError(f"Unsupported threshold operator: {op!r}")
+    rows = rows[::-1]
+    cutoffs = tuple(row[0] for row in rows)
+    buckets = (otherwise,) + tuple(row[1:] for row in rows)
+    return ScoreTable(cutoffs, buckets, bisect.bisect_left if op == ">" else bisect.bisect_right, scale, 0, shown)
+
+def _score_table(value: Any, table: ScoreTable) -> Tuple[int, List[str]]:
+    cutoffs, buckets, find, scale, nan_bucket, shown = table
+    if scale != 1:
+        value = value * scale
+    points, template = buckets[find(cutoffs, value) if value == value else nan_bucket]
+    return points, [template % (value if shown is None else shown(value),)]
+
+@functools.lru_cache(maxsize=None)
+def _vec_table(table: ScoreTable) -> Tuple[Any, np.ndarray]:
+    """
+    (comparison ufunc, bucket points) such that the bucket index of a value is the number of
+    cutoffs it compares true against. "<" tables count the cutoffs above the value and read
+    points back to front, so NaN (which compares false everywhere) lands on nan_bucket.
+    """
+    points = np.array([bucket[0] for bucket in table.buckets], dtype=np.int16)
+    if table.nan_bucket:
+        return np.less, points[::-1].copy()
+    return (np.greater if table.find is bisect.bisect_left else np.greater_equal), points
+
+def _score_table_vec(values: np.ndarray, table: ScoreTable) -> np.ndarray:
+    """Bucket points for a float64 column, matching _score_table() element-wise (NaN included)."""
+    compare, points = _vec_table(table)
+    if table.scale != 1:
+        values = values * table.scale
+    # Branch-free: one comparison pass per cutoff, summed into the bucket index.
+    idx = np.zeros(len(values), dtype=np.intp)
+    for cutoff in table.cutoffs:
+        idx += compare(values, cutoff)
+    return points[idx]
+
+def _float_column(column: np.ndarray, missing: float = np.nan) -> np.ndarray:
+    """
+    float64 copy of an object column with None replaced by `missing`. Raises TypeError on str or
+    bytes, which numpy would parse ("0.25", b"1", "Infinity") but score() rejects, so those rows
+    go through score() like any other non-numeric value; raises on other non-numeric values too.
+    """
+    return np.fromiter((missing if v is None else _not_text(v) for v in column), dtype=np.float64, count=len(column))
+
+def _not_text(value: Any) -> Any:
+    if isinstance(value, (str, bytes)):
+        raise TypeError("text value %r in a numeric column" % (value,))
+    return value
+
+# Arithmetic shared by the scalar score() and column score_vec() paths (floats or float64 arrays).
+def altman_z(working_capital, total_assets, retained_earnings, ebit, market_cap, total_liabilities, sales):
+    return (
+        1.2 * (working_capital / total_assets) +
+        1.4 * (retained_earnings / total_assets) +
+        3.3 * (ebit / total_assets) +
+        0.6 * (market_cap / total_liabilities) +
+        1.0 * (sales / total_assets)
+    )
+
+GRAHAM_K = math.sqrt(22.5)
+
+def graham_number(eps, bvps):
+    return GRAHAM_K * math.sqrt(eps * bvps)
 
 # =========================
 # Metric Implementations (Extensive Set)
 # =========================
 
 # Financial Quality
+@dataclass(frozen=True, slots=True)
 class ROEMetric(StockMetric):
-    name = "Return on Equity"
-    max_points = 20
-    weight = 1.2
-    description = "Measures profitability relative to shareholder equity."
-
-    def score(self, info):
-        points = 0
-        reasons = []
-        roe = info.get('returnOnEquity')
-        if roe is not None:
-            if roe > 0.20:
-                points += 20
-                reasons.append(f"Outstanding ROE of {roe:.2f} (>20%)")
-            elif roe > 0.15:
-                points += 15
-                reasons.append(f"Strong ROE of {roe:.2f} (>15%)")
-            elif roe > 0.10:
-                points += 10
-                reasons.append(f"Moderate ROE of {roe:.2f} (>10%)")
-            else:
-                reasons.append(f"Low ROE of {roe:.2f} (≤10%)")
-        else:
-            reasons.append("ROE data not available")
-        return points, reasons
+    name: str = "Return on Equity"
+    max_points: int = 20
+    weight: float = 1.2
+    description: str = "Measures profitability relative to shareholder equity."
+
+    keys = ('returnOnEquity',)
+    missing_reason = "ROE data not available"
+    vectorizable = True
+
+    thresholds = score_table(
+        (
+            (0.20, 20, "Outstanding ROE of %.2f (>20%%)"),
+            (0.15, 15, "Strong ROE of %.2f (>15%%)"),
+            (0.10, 10, "Moderate ROE of %.2f (>10%%)"),
+        ),
+        otherwise=(0, "Low ROE of %.2f (≤10%%)"),
+    )
 
+@dataclass(frozen=True, slots=True)
 class ReturnOnAssetsMetric(StockMetric):
-    name = "Return on Assets"
-    max_points = 3
-    description = "Indicates efficient asset use (ROA > 10% is excellent)."
-    def score(self, info):
-        points = 0
-        reasons = []
-        roa = info.get('returnOnAssets')
-        if roa is not None:
-            if roa > 0.10:
-                points += 3
-                reasons.append(f"Excellent ROA: {roa*100:.2f}% (>10%)")
-            elif roa > 0.05:
-                points += 2
-                reasons.append(f"Good ROA: {roa*100:.2f}% (>5%)")
-            elif roa > 0:
-                points += 1
-                reasons.append(f"Positive ROA: {roa*100:.2f}%")
-            else:
-                reasons.append(f"Negative or zero ROA: {roa*100:.2f}%")
-        else:
-            reasons.append("ROA data not available")
-        return points, reasons
+    name: str = "Return on Assets"
+    max_points: int = 3
+    description: str = "Indicates efficient asset use (ROA > 10% is excellent)."
+    keys = ('returnOnAssets',)
+    missing_reason = "ROA data not available"
+    vectorizable = True
+    thresholds = score_table(
+        (
+            (0.10, 3, "Excellent ROA: %.2f%% (>10%%)"),
+            (0.05, 2, "Good ROA: %.2f%% (>5%%)"),
+            (0, 1, "Positive ROA: %.2f%%"),
+        ),
+        otherwise=(0, "Negative or zero ROA: %.2f%%"),
+        shown=AS_PERCENT,
+    )
 
+@dataclass(frozen=True, slots=True)
 class ROICMetric(StockMetric):
-    name = "Return on Invested Capital"
-    max_points = 4
-    description = "High ROIC (>10%) means efficient capital allocation."
-    def score(self, info):
-        points = 0
-        reasons = []
-        roic = info.get('returnOnInvestedCapital')
-        if roic is not None:
-            if roic > 0.15:
-                points += 4
-                reasons.append(f"Outstanding ROIC: {roic*100:.2f}% (>15%)")
-            elif roic > 0.10:
-                points += 2
-                reasons.append(f"Good ROIC: {roic*100:.2f}% (>10%)")
-            elif roic > 0:
-                points += 1
-                reasons.append(f"Positive ROIC: {roic*100:.2f}%")
-            else:
-                reasons.append(f"Negative or zero ROIC: {roic*100:.2f}%")
-        else:
-            reasons.append("ROIC data not available")
-        return points, reasons
+    name: str = "Return on Invested Capital"
+    max_points: int = 4
+    description: str = "High ROIC (>10%) means efficient capital allocation."
+    keys = ('returnOnInvestedCapital',)
+    missing_reason = "ROIC data not available"
+    vectorizable = True
+    thresholds = score_table(
+        (
+            (0.15, 4, "Outstanding ROIC: %.2f%% (>15%%)"),
+            (0.10, 2, "Good ROIC: %.2f%% (>10%%)"),
+            (0, 1, "Positive ROIC: %.2f%%"),
+        ),
+        otherwise=(0, "Negative or zero ROIC: %.2f%%"),
+        shown=AS_PERCENT,
+    )
 
 # Liquidity/Solvency
+@dataclass(frozen=True, slots=True)
 class DebtToEquityMetric(StockMetric):
-    name = "Debt to Equity"
-    max_points = 15
-    description = "Assesses leverage: lower is safer."
-    def score(self, info):
-        points = 0
-        reasons = []
-        dte = info.get('debtToEquity')
-        if dte is not None:
-            if dte < 0.5:
-                points += 15
-                reasons.append(f"Excellent D/E: {dte:.2f} (<0.5)")
-            elif dte < 1:
-                points += 10
-                reasons.append(f"Healthy D/E: {dte:.2f} (<1)")
-            elif dte < 2:
-                points += 5
-                reasons.append(f"Acceptable D/E: {dte:.2f} (<2)")
-            else:
-                reasons.append(f"High D/E: {dte:.2f} (≥2)")
-        else:
-            reasons.append("Debt/Equity data not available")
-        return points, reasons
+    name: str = "Debt to Equity"
+    max_points: int = 15
+    description: str = "Assesses leverage: lower is safer."
+    keys = ('debtToEquity',)
+    missing_reason = "Debt/Equity data not available"
+    vectorizable = True
+    thresholds = score_table(
+        (
+            (0.5, 15, "Excellent D/E: %.2f (<0.5)"),
+            (1, 10, "Healthy D/E: %.2f (<1)"),
+            (2, 5, "Acceptable D/E: %.2f (<2)"),
+        ),
+        otherwise=(0, "High D/E: %.2f (≥2)"),
+        op="<",
+    )
 
+@dataclass(frozen=True, slots=True)
 class CurrentRatioMetric(StockMetric):
-    name = "Current Ratio"
-    max_points = 7
-    description = "Short-term liquidity (current assets / current liabilities)."
-    def score(self, info):
-        points = 0
-        reasons = []
-        cr = info.get('currentRatio')
-        if cr is not None:
-            if cr > 2:
-                points += 7
-                reasons.append(f"Very strong current ratio {cr:.2f} (>2)")
-            elif cr > 1.5:
-                points += 5
-                reasons.append(f"Good current ratio {cr:.2f} (>1.5)")
-            elif cr > 1:
-                points += 3
-                reasons.append(f"Acceptable current ratio {cr:.2f} (>1)")
-            else:
-                reasons.append(f"Low current ratio {cr:.2f} (≤1)")
-        else:
-            reasons.append("Current ratio data not available")
-        return points, reasons
+    name: str = "Current Ratio"
+    max_points: int = 7
+    description: str = "Short-term liquidity (current assets / current liabilities)."
+    keys = ('currentRatio',)
+    missing_reason = "Current ratio data not available"
+    vectorizable = True
+    thresholds = score_table(
+        (
+            (2, 7, "Very strong current ratio %.2f (>2)"),
+            (1.5, 5, "Good current ratio %.2f (>1.5)"),
+            (1, 3, "Acceptable current ratio %.2f (>1)"),
+        ),
+        otherwise=(0, "Low current ratio %.2f (≤1)"),
+    )
 
+@dataclass(frozen=True, slots=True)
 class QuickRatioMetric(StockMetric):
-    name = "Quick Ratio"
-    max_points = 6
-    description = "Liquidity (quick assets / current liabilities)."
-    def score(self, info):
-        points = 0
-        reasons = []
-        qr = info.get('quickRatio')
-        if qr is not None:
-            if qr > 1.5:
-                points += 6
-                reasons.append(f"Excellent quick ratio {qr:.2f} (>1.5)")
-            elif qr > 1.0:
-                points += 4
-                reasons.append(f"Good quick ratio {qr:.2f} (>1.0)")
-            elif qr > 0.7:
-                points += 2
-                reasons.append(f"Acceptable quick ratio {qr:.2f} (>0.7)")
-            else:
-                reasons.append(f"Weak quick ratio {qr:.2f} (≤0.7)")
-        else:
-            reasons.append("Quick ratio data not available")
-        return points, reasons
+    name: str = "Quick Ratio"
+    max_points: int = 6
+    description: str = "Liquidity (quick assets / current liabilities)."
+    keys = ('quickRatio',)
+    missing_reason = "Quick ratio data not available"
+    vectorizable = True
+    thresholds = score_table(
+        (
+            (1.5, 6, "Excellent quick ratio %.2f (>1.5)"),
+            (1.0, 4, "Good quick ratio %.2f (>1.0)"),
+            (0.7, 2, "Acceptable quick ratio %.2f (>0.7)"),
+        ),
+        otherwise=(0, "Weak quick ratio %.2f (≤0.7)"),
+    )
 
+@dataclass(frozen=True, slots=True)
 class InterestCoverageMetric(StockMetric):
-    name = "Interest Coverage"
-    max_points = 3
-    description = "EBIT/Interest > 4 is safe (debt payments)."
-    def score(self, info):
-        points = 0
-        reasons = []
-        ebit = info.get('ebit')
-        interest_exp = info.get('interestExpense')
-        if ebit is not None and interest_exp is not None and interest_exp != 0:
-            coverage = ebit / abs(interest_exp)
-            if coverage > 8:
-                points += 3
-                reasons.append(f"Excellent Interest Coverage: {coverage:.1f}x (>8x)")
-            elif coverage > 4:
-                points += 2
-                reasons.append(f"Good Interest Coverage: {coverage:.1f}x (>4x)")
-            elif coverage > 2:
-                points += 1
-                reasons.append(f"Acceptable Interest Coverage: {coverage:.1f}x (>2x)")
-            else:
-                reasons.append(f"Low Interest Coverage: {coverage:.1f}x (≤2x)")
-        else:
-            reasons.append("Insufficient data for interest coverage")
-        return points, reasons
+    name: str = "Interest Coverage"
+    max_points: int = 3
+    description: str = "EBIT/Interest > 4 is safe (debt payments)."
+    keys = ('ebit', 'interestExpense')
+    thresholds = score_table(
+        (
+            (8, 3, "Excellent Interest Coverage: %.1fx (>8x)"),
+            (4, 2, "Good Interest Coverage: %.1fx (>4x)"),
+            (2, 1, "Acceptable Interest Coverage: %.1fx (>2x)"),
+        ),
+        otherwise=(0, "Low Interest Coverage: %.1fx (≤2x)"),
+    )
+    def score(self, values):
+        ebit, interest_exp = values
+        if ebit is None or interest_exp is None or interest_exp == 0:
+            return 0, ["Insufficient data for interest coverage"]
+        return _score_table(ebit / abs(interest_exp), self.thresholds)
+
+    def score_vec(self, columns, size):
+        try:
+            ebit, interest_exp = (_float_column(column) for column in columns)
+        except (TypeError, ValueError):
+            return StockMetric.score_vec(self, columns, size)
+        # Missing values are NaN, so their coverage lands in the NaN bucket (0 points) like score().
+        with np.errstate(divide="ignore", invalid="ignore"):
+            coverage = ebit / np.abs(interest_exp)
+        return np.where(interest_exp != 0, _score_table_vec(coverage, self.thresholds), 0).astype(np.int16)
 
 # Profitability
+@dataclass(frozen=True, slots=True)
 class ProfitMarginMetric(StockMetric):
-    name = "Profit Margin"
-    max_points = 12
-    description = "Profit as a % of revenue."
-    def score(self, info):
-        points = 0
-        reasons = []
-        pm = info.get('profitMargins')
-        if pm is not None:
-            pm_percent = pm * 100
-            if pm_percent > 20:
-                points += 12
-                reasons.append(f"Excellent profit margin {pm_percent:.2f}% (>20%)")
-            elif pm_percent > 10:
-                points += 8
-                reasons.append(f"Good profit margin {pm_percent:.2f}% (>10%)")
-            elif pm_percent > 5:
-                points += 4
-                reasons.append(f"Thin profit margin {pm_percent:.2f}% (>5%)")
-            else:
-                reasons.append(f"Very thin profit margin {pm_percent:.2f}% (≤5%)")
-        else:
-            reasons.append("Profit margin data not available")
-        return points, reasons
+    name: str = "Profit Margin"
+    max_points: int = 12
+    description: str = "Profit as a % of revenue."
+    keys = ('profitMargins',)
+    missing_reason = "Profit margin data not available"
+    vectorizable = True
+    thresholds = score_table(
+        (
+            (20, 12, "Excellent profit margin %.2f%% (>20%%)"),
+            (10, 8, "Good profit margin %.2f%% (>10%%)"),
+            (5, 4, "Thin profit margin %.2f%% (>5%%)"),
+        ),
+        otherwise=(0, "Very thin profit margin %.2f%% (≤5%%)"),
+        scale=100,
+    )
 
+@dataclass(frozen=True, slots=True)
 class OperatingMarginMetric(StockMetric):
-    name = "Operating Margin"
-    max_points = 10
-    description = "Operating profit as % of revenue."
-    def score(self, info):
-        points = 0
-        reasons = []
-        opm = info.get('operatingMargins')
-        if opm is not None:
-            opm_percent = opm * 100
-            if opm_percent > 20:
-                points += 10
-                reasons.append(f"Strong operating margin {opm_percent:.2f}% (>20%)")
-            elif opm_percent > 10:
-                points += 6
-                reasons.append(f"Good operating margin {opm_percent:.2f}% (>10%)")
-            else:
-                reasons.append(f"Weak operating margin {opm_percent:.2f}% (≤10%)")
-        else:
-            reasons.append("Operating margin data not available")
-        return points, reasons
+    name: str = "Operating Margin"
+    max_points: int = 10
+    description: str = "Operating profit as % of revenue."
+    keys = ('operatingMargins',)
+    missing_reason = "Operating margin data not available"
+    vectorizable = True
+    thresholds = score_table(
+        (
+            (20, 10, "Strong operating margin %.2f%% (>20%%)"),
+            (10, 6, "Good operating margin %.2f%% (>10%%)"),
+        ),
+        otherwise=(0, "Weak operating margin %.2f%% (≤10%%)"),
+        scale=100,
+    )
 
+@dataclass(frozen=True, slots=True)
 class FreeCashFlowMetric(StockMetric):
-    name = "Free Cash Flow"
-    max_points = 10
-    description = "Positive FCF is rewarded."
-    def score(self, info):
+    name: str = "Free Cash Flow"
+    max_points: int = 10
+    description: str = "Positive FCF is rewarded."
+    keys = ('freeCashflow',)
+    def score(self, values):
         points = 0
         reasons = []
-        fcf = info.get('freeCashflow')
+        (fcf,) = values
         if fcf is not None:
             if fcf > 0:
                 points += 10
@@ -301,682 +904,742 @@ class FreeCashFlowMetric(StockMetric):
             reasons.append("Free Cash Flow data not available")
         return points, reasons
 
+    def score_vec(self, columns, size):
+        try:
+            fcf = _float_column(columns[0])
+        except (TypeError, ValueError):
+            return StockMetric.score_vec(self, columns, size)
+        return np.where(fcf > 0, 10, 0).astype(np.int16)
+
+@dataclass(frozen=True, slots=True)
 class PriceToFreeCashFlowMetric(StockMetric):
-    name = "P/FCF Ratio"
-    max_points = 3
-    description = "P/FCF < 15 is attractive."
-    def score(self, info):
-        points = 0
-        reasons = []
-        mcap = info.get('marketCap')
-        fcf = info.get('freeCashflow')
-        if mcap and fcf and fcf > 0:
+    name: str = "P/FCF Ratio"
+    max_points: int = 3
+    description: str = "P/FCF < 15 is attractive."
+    keys = ('marketCap', 'freeCashflow')
+    thresholds = score_table(
+        (
+            (10, 3, "Very attractive P/FCF: %.2f (<10)"),
+            (15, 2, "Attractive P/FCF: %.2f (<15)"),
+        ),
+        otherwise=(0, "High P/FCF: %.2f (≥15)"),
+        op="<",
+    )
+    def score(self, values):
+        mcap, fcf = values
+        if mcap is None or fcf is None or not (math.isfinite(mcap) and math.isfinite(fcf) and mcap > 0 and fcf > 0):
+            return 0, ["Not enough data for P/FCF"]
+        return _score_table(mcap / fcf, self.thresholds)
+
+    def score_vec(self, columns, size):
+        try:
+            mcap, fcf = (_float_column(column) for column in columns)
+        except (TypeError, ValueError):
+            return StockMetric.score_vec(self, columns, size)
+        valid = np.isfinite(mcap) & np.isfinite(fcf) & (mcap > 0) & (fcf > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
             pfcf = mcap / fcf
-            if pfcf < 10:
-                points += 3
-                reasons.append(f"Very attractive P/FCF: {pfcf:.2f} (<10)")
-            elif pfcf < 15:
-                points += 2
-                reasons.append(f"Attractive P/FCF: {pfcf:.2f} (<15)")
-            else:
-                reasons.append(f"High P/FCF: {pfcf:.2f} (≥15)")
-        else:
-            reasons.append("Not enough data for P/FCF")
-        return points, reasons
+        return np.where(valid, _score_table_vec(pfcf, self.thresholds), 0).astype(np.int16)
 
 # Growth
+@dataclass(frozen=True, slots=True)
 class RevenueGrowthMetric(StockMetric):
-    name = "Revenue Growth"
-    max_points = 10
-    description = "Year-over-year revenue growth."
-    def score(self, info):
-        points = 0
-        reasons = []
-        rev_growth = info.get('revenueGrowth')
-        if rev_growth is not None:
-            pct = rev_growth * 100
-            if pct > 20:
-                points += 10
-                reasons.append(f"Exceptional revenue growth {pct:.2f}% (>20%)")
-            elif pct > 10:
-                points += 7
-                reasons.append(f"Strong revenue growth {pct:.2f}% (>10%)")
-            elif pct > 0:
-                points += 4
-                reasons.append(f"Positive revenue growth {pct:.2f}%")
-            else:
-                reasons.append(f"Negative revenue growth {pct:.2f}%")
-        else:
-            reasons.append("Revenue growth data not available")
-        return points, reasons
+    name: str = "Revenue Growth"
+    max_points: int = 10
+    description: str = "Year-over-year revenue growth."
+    keys = ('revenueGrowth',)
+    missing_reason = "Revenue growth data not available"
+    vectorizable = True
+    thresholds = score_table(
+        (
+            (20, 10, "Exceptional revenue growth %.2f%% (>20%%)"),
+            (10, 7, "Strong revenue growth %.2f%% (>10%%)"),
+            (0, 4, "Positive revenue growth %.2f%%"),
+        ),
+        otherwise=(0, "Negative revenue growth %.2f%%"),
+        scale=100,
+    )
 
+@dataclass(frozen=True, slots=True)
 class FiveYearRevenueGrowthMetric(StockMetric):
-    name = "5y Revenue CAGR"
-    max_points = 5
-    description = "Sustained 5-year revenue CAGR."
-    def score(self, info):
-        points = 0
-        reasons = []
-        rev5y = info.get('fiveYearAvgRevenueGrowth')
-        if rev5y is not None:
-            rev5y_pct = rev5y * 100
-            if rev5y_pct > 15:
-                points += 5
-                reasons.append(f"Outstanding 5-year revenue CAGR: {rev5y_pct:.2f}% (>15%)")
-            elif rev5y_pct > 7:
-                points += 3
-                reasons.append(f"Good 5-year revenue CAGR: {rev5y_pct:.2f}% (>7%)")
-            elif rev5y_pct > 0:
-                points += 1
-                reasons.append(f"Positive 5-year revenue CAGR: {rev5y_pct:.2f}%")
-            else:
-                reasons.append(f"Negative 5-year revenue CAGR: {rev5y_pct:.2f}%")
-        else:
-            reasons.append("5-year revenue growth data not available")
-        return points, reasons
+    name: str = "5y Revenue CAGR"
+    max_points: int = 5
+    description: str = "Sustained 5-year revenue CAGR."
+    keys = ('fiveYearAvgRevenueGrowth',)
+    missing_reason = "5-year revenue growth data not available"
+    vectorizable = True
+    thresholds = score_table(
+        (
+            (15, 5, "Outstanding 5-year revenue CAGR: %.2f%% (>15%%)"),
+            (7, 3, "Good 5-year revenue CAGR: %.2f%% (>7%%)"),
+            (0, 1, "Positive 5-year revenue CAGR: %.2f%%"),
+        ),
+        otherwise=(0, "Negative 5-year revenue CAGR: %.2f%%"),
+        scale=100,
+    )
 
+@dataclass(frozen=True, slots=True)
 class EPSGrowthMetric(StockMetric):
-    name = "EPS Growth"
-    max_points = 8
-    description = "YOY earnings per share growth."
-    def score(self, info):
-        points = 0
-        reasons = []
-        eps_growth = info.get('earningsQuarterlyGrowth')
-        if eps_growth is not None:
-            pct = eps_growth * 100
-            if pct > 15:
-                points += 8
-                reasons.append(f"Excellent EPS growth {pct:.2f}% (>15%)")
-            elif pct > 5:
-                points += 4
-                reasons.append(f"Positive EPS growth {pct:.2f}%")
-            else:
-                reasons.append(f"Minimal EPS growth {pct:.2f}% (≤5%)")
-        else:
-            reasons.append("EPS growth data not available")
-        return points, reasons
+    name: str = "EPS Growth"
+    max_points: int = 8
+    description: str = "YOY earnings per share growth."
+    keys = ('earningsQuarterlyGrowth',)
+    missing_reason = "EPS growth data not available"
+    vectorizable = True
+    thresholds = score_table(
+        (
+            (15, 8, "Excellent EPS growth %.2f%% (>15%%)"),
+            (5, 4, "Positive EPS growth %.2f%%"),
+        ),
+        otherwise=(0, "Minimal EPS growth %.2f%% (≤5%%)"),
+        scale=100,
+    )
 
+@dataclass(frozen=True, slots=True)
 class DividendGrowthMetric(StockMetric):
-    name = "Dividend Growth"
-    max_points = 4
-    description = "Rewards 3y+ consecutive dividend growth."
-    def score(self, info):
-        points = 0
-        reasons = []
-        dg = info.get('dividendGrowth')
-        if dg is not None:
-            if dg >= 5:
-                points += 4
-                reasons.append(f"{dg} years of dividend growth (≥5y)")
-            elif dg >= 3:
-                points += 2
-                reasons.append(f"{dg} years of dividend growth (≥3y)")
-            else:
-                reasons.append(f"Dividend growth streak: {dg} years (<3y)")
-        else:
-            reasons.append("Dividend growth data not available")
-        return points, reasons
+    name: str = "Dividend Growth"
+    max_points: int = 4
+    description: str = "Rewards 3y+ consecutive dividend growth."
+    keys = ('dividendGrowth',)
+    missing_reason = "Dividend growth data not available"
+    vectorizable = True
+    thresholds = score_table(
+        (
+            (5, 4, "%s years of dividend growth (≥5y)"),
+            (3, 2, "%s years of dividend growth (≥3y)"),
+        ),
+        otherwise=(0, "Dividend growth streak: %s years (<3y)"),
+        op=">=",
+    )
 
 # Valuation
+@dataclass(frozen=True, slots=True)
 class PERatioMetric(StockMetric):
-    name = "P/E Ratio"
-    max_points = 5
-    description = "Low P/E (<15) is rewarded."
-    def score(self, info):
-        points = 0
-        reasons = []
-        pe = info.get('trailingPE')
-        if pe is not None and pe > 0:
-            if pe < 15:
-                points += 5
-                reasons.append(f"Low P/E: {pe:.2f} (<15)")
-            elif pe < 25:
-                points += 3
-                reasons.append(f"Reasonable P/E: {pe:.2f} (<25)")
-            else:
-                reasons.append(f"High P/E: {pe:.2f} (≥25)")
-        else:
-            reasons.append("P/E ratio data not available or negative")
-        return points, reasons
+    name: str = "P/E Ratio"
+    max_points: int = 5
+    description: str = "Low P/E (<15) is rewarded."
+    keys = ('trailingPE',)
+    missing_reason = "P/E ratio data not available or negative"
+    vectorizable = True
+    positive_only = True
+    thresholds = score_table(
+        (
+            (15, 5, "Low P/E: %.2f (<15)"),
+            (25, 3, "Reasonable P/E: %.2f (<25)"),
+        ),
+        otherwise=(0, "High P/E: %.2f (≥25)"),
+        op="<",
+    )
 
+@dataclass(frozen=True, slots=True)
 class PEGMetric(StockMetric):
-    name = "PEG Ratio"
-    max_points = 3
-    description = "PEG < 1 is undervalued for growth."
-    def score(self, info):
-        points = 0
-        reasons = []
-        peg = info.get('pegRatio')
-        if peg is not None and peg > 0:
-            if peg < 1:
-                points += 3
-                reasons.append(f"Low PEG: {peg:.2f} (<1, undervalued)")
-            elif peg < 2:
-                points += 1
-                reasons.append(f"Reasonable PEG: {peg:.2f} (<2)")
-            else:
-                reasons.append(f"High PEG: {peg:.2f} (≥2)")
-        else:
-            reasons.append("PEG ratio data not available or N/A")
-        return points, reasons
+    name: str = "PEG Ratio"
+    max_points: int = 3
+    description: str = "PEG < 1 is undervalued for growth."
+    keys = ('pegRatio',)
+    missing_reason = "PEG ratio data not available or N/A"
+    vectorizable = True
+    positive_only = True
+    thresholds = score_table(
+        (
+            (1, 3, "Low PEG: %.2f (<1, undervalued)"),
+            (2, 1, "Reasonable PEG: %.2f (<2)"),
+        ),
+        otherwise=(0, "High PEG: %.2f (≥2)"),
+        op="<",
+    )
 
+@dataclass(frozen=True, slots=True)
 class PBMetric(StockMetric):
-    name = "P/B Ratio"
-    max_points = 5
-    description = "Low P/B (<2) is rewarded."
-    def score(self, info):
-        points = 0
-        reasons = []
-        pb = info.get('priceToBook')
-        if pb is not None and pb > 0:
-            if pb < 2:
-                points += 5
-                reasons.append(f"Low P/B: {pb:.2f} (<2)")
-            elif pb < 4:
-                points += 2
-                reasons.append(f"Reasonable P/B: {pb:.2f} (<4)")
-            else:
-                reasons.append(f"High P/B: {pb:.2f} (≥4)")
-        else:
-            reasons.append("P/B ratio data not available or negative")
-        return points, reasons
+    name: str = "P/B Ratio"
+    max_points: int = 5
+    description: str = "Low P/B (<2) is rewarded."
+    keys = ('priceToBook',)
+    missing_reason = "P/B ratio data not available or negative"
+    vectorizable = True
+    positive_only = True
+    thresholds = score_table(
+        (
+            (2, 5, "Low P/B: %.2f (<2)"),
+            (4, 2, "Reasonable P/B: %.2f (<4)"),
+        ),
+        otherwise=(0, "High P/B: %.2f (≥4)"),
+        op="<",
+    )
 
+@dataclass(frozen=True, slots=True)
 class PriceToSalesMetric(StockMetric):
-    name = "P/S Ratio"
-    max_points = 4
-    description = "P/S < 2 is best."
-    def score(self, info):
-        points = 0
-        reasons = []
-        ps = info.get('priceToSalesTrailing12Months')
-        if ps is not None and ps > 0:
-            if ps < 2:
-                points += 4
-                reasons.append(f"Low P/S: {ps:.2f} (<2)")
-            elif ps < 4:
-                points += 2
-                reasons.append(f"Reasonable P/S: {ps:.2f} (<4)")
-            else:
-                reasons.append(f"High P/S: {ps:.2f} (≥4)")
-        else:
-            reasons.append("P/S ratio data not available or N/A")
-        return points, reasons
+    name: str = "P/S Ratio"
+    max_points: int = 4
+    description: str = "P/S < 2 is best."
+    keys = ('priceToSalesTrailing12Months',)
+    missing_reason = "P/S ratio data not available or N/A"
+    vectorizable = True
+    positive_only = True
+    thresholds = score_table(
+        (
+            (2, 4, "Low P/S: %.2f (<2)"),
+            (4, 2, "Reasonable P/S: %.2f (<4)"),
+        ),
+        otherwise=(0, "High P/S: %.2f (≥4)"),
+        op="<",
+    )
 
+@dataclass(frozen=True, slots=True)
 class GrahamNumberMetric(StockMetric):
-    name = "Graham Number"
-    max_points = 4
-    description = "Rewards stocks trading below Graham Number (undervalued)."
-    def score(self, info):
-        points = 0
-        reasons = []
-        eps = info.get('trailingEps')
-        bvps = info.get('bookValue')
-        price = info.get('currentPrice')
-        if eps and bvps and price:
-            graham = (22.5 * eps * bvps) ** 0.5
-            if price < graham:
-                points += 4
-                reasons.append("Trading below Graham Number (undervalued)")
-            else:
-                reasons.append("Trading above Graham Number (not undervalued)")
-        else:
-            reasons.append("Not enough data for Graham Number")
-        return points, reasons
-
-class PriceToFreeCashFlowMetric(StockMetric):
-    name = "P/FCF Ratio"
-    max_points = 3
-    description = "P/FCF < 15 rewarded."
-    def score(self, info):
-        points = 0
-        reasons = []
-        mcap = info.get('marketCap')
-        fcf = info.get('freeCashflow')
-        if mcap and fcf and fcf > 0:
-            pfcf = mcap / fcf
-            if pfcf < 10:
-                points += 3
-                reasons.append(f"Very attractive P/FCF: {pfcf:.2f} (<10)")
-            elif pfcf < 15:
-                points += 2
-                reasons.append(f"Attractive P/FCF: {pfcf:.2f} (<15)")
-            else:
-                reasons.append(f"High P/FCF: {pfcf:.2f} (≥15)")
-        else:
-            reasons.append("Not enough data for P/FCF")
-        return points, reasons
+    name: str = "Graham Number"
+    max_points: int = 4
+    description: str = "Rewards stocks trading below Graham Number (undervalued)."
+    keys = ('trailingEps', 'bookValue', 'currentPrice')
+    def score(self, values):
+        eps, bvps, price = values
+        if (None in values or not (math.isfinite(eps) and math.isfinite(bvps) and math.isfinite(price))
+                or not (eps and bvps and price > 0)):
+            return 0, ["Not enough data for Graham Number"]
+        if eps < 0 or bvps < 0:
+            return 0, ["Negative EPS or book value (no Graham Number)"]
+        if price < graham_number(eps, bvps):
+            return 4, ["Trading below Graham Number (undervalued)"]
+        return 0, ["Trading above Graham Number (not undervalued)"]
+
+    def score_vec(self, columns, size):
+        try:
+            eps, bvps, price = (_float_column(column) for column in columns)
+        except (TypeError, ValueError):
+            return StockMetric.score_vec(self, columns, size)
+        valid = np.isfinite(eps) & np.isfinite(bvps) & np.isfinite(price) & (eps > 0) & (bvps > 0) & (price > 0)
+        with np.errstate(invalid="ignore"):
+            below = price < GRAHAM_K * np.sqrt(eps * bvps)
+        return np.where(valid & below, 4, 0).astype(np.int16)
 
 # Dividend / Payout
+@dataclass(frozen=True, slots=True)
 class DividendMetric(StockMetric):
-    name = "Dividend Yield"
-    max_points = 5
-    description = "Rewards decent dividend yield."
-    def score(self, info):
-        points = 0
-        reasons = []
-        div_yield = info.get('dividendYield')
-        if div_yield is not None:
-            pct = div_yield * 100
-            if pct > 3:
-                points += 5
-                reasons.append(f"Attractive dividend yield {pct:.2f}% (>3%)")
-            elif pct > 1:
-                points += 2
-                reasons.append(f"Modest dividend yield {pct:.2f}%")
-            else:
-                reasons.append(f"Low dividend yield {pct:.2f}% (≤1%)")
-        else:
-            reasons.append("Dividend yield data not available")
-        return points, reasons
+    name: str = "Dividend Yield"
+    max_points: int = 5
+    description: str = "Rewards decent dividend yield."
+    keys = ('dividendYield',)
+    missing_reason = "Dividend yield data not available"
+    vectorizable = True
+    thresholds = score_table(
+        (
+            (3, 5, "Attractive dividend yield %.2f%% (>3%%)"),
+            (1, 2, "Modest dividend yield %.2f%%"),
+        ),
+        otherwise=(0, "Low dividend yield %.2f%% (≤1%%)"),
+        scale=100,
+    )
 
+@dataclass(frozen=True, slots=True)
 class PayoutRatioMetric(StockMetric):
-    name = "Payout Ratio"
-    max_points = 3
-    description = "Payout ratio <60% is sustainable."
-    def score(self, info):
-        points = 0
-        reasons = []
-        payout = info.get('payoutRatio')
-        if payout is not None and payout > 0:
-            payout_pct = payout * 100
-            if payout < 0.4:
-                points += 3
-                reasons.append(f"Conservative payout ratio: {payout_pct:.1f}% (<40%)")
-            elif payout < 0.6:
-                points += 2
-                reasons.append(f"Manageable payout ratio: {payout_pct:.1f}% (<60%)")
-            else:
-                reasons.append(f"High payout ratio: {payout_pct:.1f}% (≥60%)")
-        else:
-            reasons.append("Payout ratio data not available or N/A")
-        return points, reasons
+    name: str = "Payout Ratio"
+    max_points: int = 3
+    description: str = "Payout ratio <60% is sustainable."
+    keys = ('payoutRatio',)
+    vectorizable = True
+    positive_only = True
+    thresholds = score_table(
+        (
+            (0.4, 3, "Conservative payout ratio: %.1f%% (<40%%)"),
+            (0.6, 2, "Manageable payout ratio: %.1f%% (<60%%)"),
+        ),
+        otherwise=(0, "High payout ratio: %.1f%% (≥60%%)"),
+        op="<",
+        shown=AS_PERCENT,
+    )
+    def score(self, values):
+        (payout,) = values
+        if payout is None or not (math.isfinite(payout) and payout > 0):
+            return 0, ["Payout ratio data not available or N/A"]
+        return _score_table(payout, self.thresholds)
 
 # Sentiment, Insider, Institutional
+@dataclass(frozen=True, slots=True)
 class ShortFloatMetric(StockMetric):
-    name = "Short Interest %"
-    max_points = 4
-    description = "Penalizes high short interest (risk/negative sentiment)."
-    def score(self, info):
-        points = 0
-        reasons = []
-        short_percent = info.get('shortPercentOfFloat')
-        if short_percent is not None:
-            if short_percent < 0.02:
-                points += 4
-                reasons.append(f"Very low short interest: {short_percent*100:.2f}% (<2%)")
-            elif short_percent < 0.05:
-                points += 2
-                reasons.append(f"Low short interest: {short_percent*100:.2f}% (<5%)")
-            elif short_percent < 0.10:
-                points += 1
-                reasons.append(f"Moderate short interest: {short_percent*100:.2f}% (<10%)")
-            else:
-                reasons.append(f"High short interest: {short_percent*100:.2f}% (≥10%)")
-        else:
-            reasons.append("Short interest data not available")
-        return points, reasons
+    name: str = "Short Interest %"
+    max_points: int = 4
+    description: str = "Penalizes high short interest (risk/negative sentiment)."
+    keys = ('shortPercentOfFloat',)
+    missing_reason = "Short interest data not available"
+    vectorizable = True
+    thresholds = score_table(
+        (
+            (0.02, 4, "Very low short interest: %.2f%% (<2%%)"),
+            (0.05, 2, "Low short interest: %.2f%% (<5%%)"),
+            (0.10, 1, "Moderate short interest: %.2f%% (<10%%)"),
+        ),
+        otherwise=(0, "High short interest: %.2f%% (≥10%%)"),
+        op="<",
+        shown=AS_PERCENT,
+    )
 
+@dataclass(frozen=True, slots=True)
 class AnalystRecommendationMetric(StockMetric):
-    name = "Analyst Recommendation"
-    max_points = 5
-    description = "Strong buy/buy consensus rewarded."
-    def score(self, info):
-        points = 0
-        reasons = []
-        reco = info.get('recommendationKey')
-        if reco is not None:
-            if reco == "strong_buy":
-                points += 5
-                reasons.append("Analyst consensus: Strong Buy")
-            elif reco == "buy":
-                points += 3
-                reasons.append("Analyst consensus: Buy")
-            elif reco == "hold":
-                points += 1
-                reasons.append("Analyst consensus: Hold")
-            else:
-                reasons.append(f"Analyst consensus: {reco.replace('_', ' ').title()}")
-        else:
-            reasons.append("Analyst recommendation not available")
-        return points, reasons
-
+    name: str = "Analyst Recommendation"
+    max_points: int = 5
+    description: str = "Strong buy/buy consensus rewarded."
+    keys = ('recommendationKey',)
+    # recommendationKey -> (points, reason); other keys score 0 with a title-cased reason.
+    consensus = {
+        "strong_buy": (5, "Analyst consensus: Strong Buy"),
+        "buy": (3, "Analyst consensus: Buy"),
+        "hold": (1, "Analyst consensus: Hold"),
+    }
+    def score(self, values):
+        (reco,) = values
+        if reco is None:
+            return 0, ["Analyst recommendation not available"]
+        known = self.consensus.get(reco)
+        if known is None:
+            return 0, ["Analyst consensus: %s" % reco.replace('_', ' ').title()]
+        points, reason = known
+        return points, [reason]
+
+@dataclass(frozen=True, slots=True)
 class InsiderOwnershipMetric(StockMetric):
-    name = "Insider Ownership"
-    max_points = 5
-    description = "Rewards substantial insider ownership."
-    def score(self, info):
-        points = 0
-        reasons = []
-        insider_percent = info.get('heldPercentInsiders')
-        if insider_percent is not None:
-            if insider_percent > 0.1:
-                points += 5
-                reasons.append(f"High insider ownership: {insider_percent * 100:.2f}% (>10%)")
-            elif insider_percent > 0.03:
-                points += 3
-                reasons.append(f"Moderate insider ownership: {insider_percent * 100:.2f}% (>3%)")
-            else:
-                reasons.append(f"Low insider ownership: {insider_percent * 100:.2f}% (≤3%)")
-        else:
-            reasons.append("Insider ownership data not available")
-        return points, reasons
+    name: str = "Insider Ownership"
+    max_points: int = 5
+    description: str = "Rewards substantial insider ownership."
+    keys = ('heldPercentInsiders',)
+    missing_reason = "Insider ownership data not available"
+    vectorizable = True
+    thresholds = score_table(
+        (
+            (0.1, 5, "High insider ownership: %.2f%% (>10%%)"),
+            (0.03, 3, "Moderate insider ownership: %.2f%% (>3%%)"),
+        ),
+        otherwise=(0, "Low insider ownership: %.2f%% (≤3%%)"),
+        shown=AS_PERCENT,
+    )
 
+@dataclass(frozen=True, slots=True)
 class InstitutionalOwnershipMetric(StockMetric):
-    name = "Institutional Ownership"
-    max_points = 5
-    description = "Rewards strong institutional backing."
-    def score(self, info):
-        points = 0
-        reasons = []
-        ii_percent = info.get('heldPercentInstitutions')
-        if ii_percent is not None:
-            if ii_percent > 0.7:
-                points += 5
-                reasons.append(f"High institutional ownership: {ii_percent * 100:.2f}% (>70%)")
-            elif ii_percent > 0.4:
-                points += 3
-                reasons.append(f"Moderate institutional ownership: {ii_percent * 100:.2f}% (>40%)")
-            else:
-                reasons.append(f"Low institutional ownership: {ii_percent * 100:.2f}% (≤40%)")
-        else:
-            reasons.append("Institutional ownership data not available")
-        return points, reasons
+    name: str = "Institutional Ownership"
+    max_points: int = 5
+    description: str = "Rewards strong institutional backing."
+    keys = ('heldPercentInstitutions',)
+    missing_reason = "Institutional ownership data not available"
+    vectorizable = True
+    thresholds = score_table(
+        (
+            (0.7, 5, "High institutional ownership: %.2f%% (>70%%)"),
+            (0.4, 3, "Moderate institutional ownership: %.2f%% (>40%%)"),
+        ),
+        otherwise=(0, "Low institutional ownership: %.2f%% (≤40%%)"),
+        shown=AS_PERCENT,
+    )
 
 # ESG and Risk
+@dataclass(frozen=True, slots=True)
 class ESGScoreMetric(StockMetric):
-    name = "ESG Score"
-    max_points = 5
-    description = "Environmental/Social/Governance risk score."
-    def score(self, info):
-        points = 0
-        reasons = []
-        esg = info.get('esgScores')
-        if esg and isinstance(esg, dict):
-            combined_score = esg.get('totalEsg')
-            if combined_score is not None:
-                if combined_score < 25:
-                    points += 5
-                    reasons.append(f"Excellent ESG risk score: {combined_score:.1f} (<25)")
-                elif combined_score < 40:
-                    points += 3
-                    reasons.append(f"Good ESG risk score: {combined_score:.1f} (<40)")
-                else:
-                    reasons.append(f"High ESG risk score: {combined_score:.1f} (≥40, higher is worse)")
-            else:
-                reasons.append("Total ESG score not available")
-        else:
-            reasons.append("ESG data not available")
-        return points, reasons
-
+    name: str = "ESG Score"
+    max_points: int = 5
+    description: str = "Environmental/Social/Governance risk score."
+    keys = ('esgScores',)
+    thresholds = score_table(
+        (
+            (25, 5, "Excellent ESG risk score: %.1f (<25)"),
+            (40, 3, "Good ESG risk score: %.1f (<40)"),
+        ),
+        otherwise=(0, "High ESG risk score: %.1f (≥40, higher is worse)"),
+        op="<",
+    )
+    def score(self, values):
+        (esg,) = values
+        if not (esg and isinstance(esg, dict)):
+            return 0, ["ESG data not available"]
+        combined_score = esg.get("totalEsg")
+        if combined_score is None:
+            return 0, ["Total ESG score not available"]
+        return _score_table(combined_score, self.thresholds)
+
+@dataclass(frozen=True, slots=True)
 class AltmanZScoreMetric(StockMetric):
-    name = "Altman Z-Score"
-    max_points = 6
-    description = "Bankruptcy risk (higher is safer)."
-    def score(self, info):
+    name: str = "Altman Z-Score"
+    max_points: int = 6
+    description: str = "Bankruptcy risk (higher is safer)."
+    keys = (
+        'totalCurrentAssets',
+        'totalCurrentLiabilities',
+        'totalAssets',
+        'retainedEarnings',
+        'ebit',
+        'marketCap',
+        'totalLiab',
+        'totalRevenue',
+    )
+    all_keys_required = False
+    thresholds = score_table(
+        (
+            (3.0, 6, "Very safe Altman Z-Score: %.2f (>3.0)"),
+            (2.5, 4, "Safe Altman Z-Score: %.2f (>2.5)"),
+            (1.8, 2, "Warning Altman Z-Score: %.2f (>1.8)"),
+        ),
+        otherwise=(0, "Distress Altman Z-Score: %.2f (≤1.8)"),
+    )
+    def score(self, values):
         points = 0
         reasons = []
         try:
-            wc_ta = info.get('totalCurrentAssets', 0) - info.get('totalCurrentLiabilities', 0)
-            total_assets = info.get('totalAssets', 0)
-            retained_earnings = info.get('retainedEarnings', 0)
-            ebit = info.get('ebit', 0)
-            market_cap = info.get('marketCap', 0)
-            total_liabilities = info.get('totalLiab', 0)
-            sales = info.get('totalRevenue', 0)
+            (current_assets, current_liabilities, total_assets, retained_earnings,
+             ebit, market_cap, total_liabilities, sales) = (0 if v is None else v for v in values)
+            wc_ta = current_assets - current_liabilities
             if all(x > 0 for x in [total_assets, total_liabilities, sales, market_cap]):
-                z = (
-                    1.2 * (wc_ta / total_assets) +
-                    1.4 * (retained_earnings / total_assets) +
-                    3.3 * (ebit / total_assets) +
-                    0.6 * (market_cap / total_liabilities) +
-                    1.0 * (sales / total_assets)
-                )
-                if z > 3.0:
-                    points += 6
-                    reasons.append(f"Very safe Altman Z-Score: {z:.2f} (>3.0)")
-                elif z > 2.5:
-                    points += 4
-                    reasons.append(f"Safe Altman Z-Score: {z:.2f} (>2.5)")
-                elif z > 1.8:
-                    points += 2
-                    reasons.append(f"Warning Altman Z-Score: {z:.2f} (>1.8)")
-                else:
-                    reasons.append(f"Distress Altman Z-Score: {z:.2f} (≤1.8)")
-            else:
-                reasons.append("Insufficient data for Altman Z-Score")
+                z = altman_z(wc_ta, total_assets, retained_earnings, ebit, market_cap, total_liabilities, sales)
+                return _score_table(z, self.thresholds)
+            reasons.append("Insufficient data for Altman Z-Score")
         except Exception:
             reasons.append("Could not compute Altman Z-Score")
         return points, reasons
 
+    def score_vec(self, columns, size):
+        try:
+            (current_assets, current_liabilities, total_assets, retained_earnings,
+             ebit, market_cap, total_liabilities, sales) = (_float_column(column, missing=0.0) for column in columns)
+        except (TypeError, ValueError):
+            return StockMetric.score_vec(self, columns, size)
+        valid = (total_assets > 0) & (total_liabilities > 0) & (sales > 0) & (market_cap > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = altman_z(current_assets - current_liabilities, total_assets, retained_earnings,
+                         ebit, market_cap, total_liabilities, sales)
+        return np.where(valid, _score_table_vec(z, self.thresholds), 0).astype(np.int16)
+
 # Size, Liquidity, Volatility
+@dataclass(frozen=True, slots=True)
 class MarketCapMetric(StockMetric):
-    name = "Market Capitalization"
-    max_points = 5
-    description = "Rewards large and stable companies."
-    def score(self, info):
+    name: str = "Market Capitalization"
+    max_points: int = 5
+    description: str = "Rewards large and stable companies."
+    keys = ('marketCap',)
+    def score(self, values):
         points = 0
         reasons = []
-        mcap = info.get('marketCap')
+        (mcap,) = values
         if mcap is not None:
             if mcap > 1e11:
                 points += 5
-                reasons.append(f"Very large market cap: ${mcap/1e9:.1f}B")
+                reasons.append("Very large market cap: $%.1fB" % (mcap / 1e9))
             elif mcap > 1e10:
                 points += 3
-                reasons.append(f"Large market cap: ${mcap/1e9:.1f}B")
+                reasons.append("Large market cap: $%.1fB" % (mcap / 1e9))
             elif mcap > 1e9:
                 points += 1
-                reasons.append(f"Mid cap: ${mcap/1e9:.1f}B")
+                reasons.append("Mid cap: $%.1fB" % (mcap / 1e9))
             else:
-                reasons.append(f"Small cap: ${mcap/1e6:.1f}M")
+                reasons.append("Small cap: $%.1fM" % (mcap / 1e6))
         else:
             reasons.append("Market cap data not available")
         return points, reasons
 
+    def score_vec(self, columns, size):
+        try:
+            mcap = _float_column(columns[0])
+        except (TypeError, ValueError):
+            return StockMetric.score_vec(self, columns, size)
+        tier = (mcap > 1e9).astype(np.intp) + (mcap > 1e10) + (mcap > 1e11)
+        return np.array([0, 1, 3, 5], dtype=np.int16)[tier]
+
+@dataclass(frozen=True, slots=True)
 class AvgVolumeMetric(StockMetric):
-    name = "Avg Volume (Liquidity)"
-    max_points = 4
-    description = "Rewards daily trading liquidity."
-    def score(self, info):
-        points = 0
-        reasons = []
-        avgvol = info.get('averageDailyVolume10Day')
-        if avgvol is not None:
-            if avgvol >= 1_000_000:
-                points += 4
-                reasons.append(f"Excellent liquidity: {avgvol:,}/day")
-            elif avgvol >= 300_000:
-                points += 2
-                reasons.append(f"Acceptable liquidity: {avgvol:,}/day")
-            else:
-                reasons.append(f"Low liquidity: {avgvol:,}/day (<300k)")
-        else:
-            reasons.append("Average volume data not available")
-        return points, reasons
+    name: str = "Avg Volume (Liquidity)"
+    max_points: int = 4
+    description: str = "Rewards daily trading liquidity."
+    keys = ('averageDailyVolume10Day',)
+    missing_reason = "Average volume data not available"
+    vectorizable = True
+    thresholds = score_table(
+        (
+            (1_000_000, 4, "Excellent liquidity: %s/day"),
+            (300_000, 2, "Acceptable liquidity: %s/day"),
+        ),
+        otherwise=(0, "Low liquidity: %s/day (<300k)"),
+        op=">=",
+        shown=WITH_COMMAS,
+    )
 
+@dataclass(frozen=True, slots=True)
 class BetaMetric(StockMetric):
-    name = "Beta (Volatility)"
-    max_points = 4
-    description = "Rewards lower-than-market volatility."
-    def score(self, info):
+    name: str = "Beta (Volatility)"
+    max_points: int = 4
+    description: str = "Rewards lower-than-market volatility."
+    keys = ('beta',)
+    def score(self, values):
         points = 0
         reasons = []
-        beta = info.get('beta')
+        (beta,) = values
         if beta is not None:
             if 0 < beta < 1:
                 points += 4
-                reasons.append(f"Lower-than-market volatility (beta={beta:.2f})")
+                reasons.append("Lower-than-market volatility (beta=%.2f)" % beta)
             elif 1 <= beta < 1.3:
                 points += 2
-                reasons.append(f"Market-level volatility (beta={beta:.2f})")
+                reasons.append("Market-level volatility (beta=%.2f)" % beta)
             else:
-                reasons.append(f"High volatility (beta={beta:.2f})")
+                reasons.append("High volatility (beta=%.2f)" % beta)
         else:
             reasons.append("Beta data not available")
         return points, reasons
 
+    def score_vec(self, columns, size):
+        try:
+            beta = _float_column(columns[0])
+        except (TypeError, ValueError):
+            return StockMetric.score_vec(self, columns, size)
+        return np.select([(beta > 0) & (beta < 1), (beta >= 1) & (beta < 1.3)], [4, 2], 0).astype(np.int16)
+
 # Technicals & Longevity
+@dataclass(frozen=True, slots=True)
 class PriceMomentumMetric(StockMetric):
-    name = "1y Price Momentum"
-    max_points = 3
-    description = "Rewards positive 12-month price performance."
-    def score(self, info):
+    name: str = "1y Price Momentum"
+    max_points: int = 3
+    description: str = "Rewards positive 12-month price performance."
+    uses_price_history: bool = True
+    keys = ('symbol',)
+    thresholds = score_table(
+        (
+            (30, 3, "Strong 1y price momentum: %.1f%% (>30%%)"),
+            (10, 2, "Good 1y price momentum: %.1f%% (>10%%)"),
+            (0, 1, "Positive 1y price momentum: %.1f%%"),
+        ),
+        otherwise=(0, "Negative 1y price momentum: %.1f%%"),
+        scale=100,
+    )
+    def score(self, values):
         points = 0
         reasons = []
-        symbol = info.get('symbol')
+        (symbol,) = values
         if not symbol:
             reasons.append("Ticker symbol not available for price momentum metric")
             return points, reasons
         try:
-            hist = yf.Ticker(symbol).history(period="1y")
-            if not hist.empty:
-                price_change = (hist['Close'][-1] - hist['Close'][0]) / hist['Close'][0]
-                pct = price_change * 100
-                if pct > 30:
-                    points += 3
-                    reasons.append(f"Strong 1y price momentum: {pct:.1f}% (>30%)")
-                elif pct > 10:
-                    points += 2
-                    reasons.append(f"Good 1y price momentum: {pct:.1f}% (>10%)")
-                elif pct > 0:
-                    points += 1
-                    reasons.append(f"Positive 1y price momentum: {pct:.1f}%")
-                else:
-                    reasons.append(f"Negative 1y price momentum: {pct:.1f}%")
-            else:
-                reasons.append("No 1y price history available")
+            closes = get_close_anchors(symbol)
+            if closes.size:
+                # Plain floats keep NumPy scalars out of the scoring arithmetic.
+                price_change = float(closes[-1]) / float(closes[0]) - 1.0
+                return _score_table(price_change, self.thresholds)
+            reasons.append("No 1y price history available")
         except Exception:
             reasons.append("Failed to compute 1y price momentum")
         return points, reasons
 
+@dataclass(frozen=True, slots=True)
 class CompanyAgeMetric(StockMetric):
-    name = "Company Longevity"
-    max_points = 3
-    description = "Rewards older, established companies."
-    def score(self, info):
+    name: str = "Company Longevity"
+    max_points: int = 3
+    description: str = "Rewards older, established companies."
+    keys = ('ipoYear', 'startDate')
+    all_keys_required = False
+    def score(self, values):
         points = 0
         reasons = []
-        ipo_year = info.get('ipoYear')
+        ipo_year, start_date = values
         if ipo_year is None:
-            start_date = info.get('startDate')
             if start_date:
                 try:
                     ipo_year = int(str(start_date)[:4])
                 except Exception:
                     ipo_year = None
         if ipo_year:
-            current_year = datetime.utcnow().year
+            current_year = _today_year()
             age = current_year - int(ipo_year)
             if age > 30:
                 points += 3
-                reasons.append(f"Mature company (age={age}y, IPO {ipo_year})")
+                reasons.append("Mature company (age=%sy, IPO %s)" % (age, ipo_year))
             elif age > 10:
                 points += 2
-                reasons.append(f"Established company (age={age}y, IPO {ipo_year})")
+                reasons.append("Established company (age=%sy, IPO %s)" % (age, ipo_year))
             elif age > 3:
                 points += 1
-                reasons.append(f"Newer public company (age={age}y, IPO {ipo_year})")
+                reasons.append("Newer public company (age=%sy, IPO %s)" % (age, ipo_year))
             else:
-                reasons.append(f"Very recent IPO (age={age}y, IPO {ipo_year})")
+                reasons.append("Very recent IPO (age=%sy, IPO %s)" % (age, ipo_year))
         else:
             reasons.append("IPO year/start date not available")
         return points, reasons
 
+# Default metric set, built once; metrics are frozen so every scorer can share the instances.
+DEFAULT_METRICS: Tuple[StockMetric, ...] = (
+    ROEMetric(),
+    ReturnOnAssetsMetric(),
+    ROICMetric(),
+    DebtToEquityMetric(),
+    CurrentRatioMetric(),
+    QuickRatioMetric(),
+    InterestCoverageMetric(),
+    ProfitMarginMetric(),
+    OperatingMarginMetric(),
+    FreeCashFlowMetric(),
+    PriceToFreeCashFlowMetric(),
+    RevenueGrowthMetric(),
+    FiveYearRevenueGrowthMetric(),
+    EPSGrowthMetric(),
+    DividendGrowthMetric(),
+    PERatioMetric(),
+    PEGMetric(),
+    PBMetric(),
+    PriceToSalesMetric(),
+    GrahamNumberMetric(),
+    DividendMetric(),
+    PayoutRatioMetric(),
+    ShortFloatMetric(),
+    AnalystRecommendationMetric(),
+    InsiderOwnershipMetric(),
+    InstitutionalOwnershipMetric(),
+    ESGScoreMetric(),
+    AltmanZScoreMetric(),
+    MarketCapMetric(),
+    AvgVolumeMetric(),
+    BetaMetric(),
+    PriceMomentumMetric(),
+    CompanyAgeMetric(),
+)
+
 # =========================
 # DrovalixScorer
 # =========================
 
+RATINGS = ("Weak", "Average", "Good", "Very Good", "Excellent")
+RATING_PERCENTS = (40, 55, 70, 85)
+
+def rating_cuts(max_score: int) -> List[int]:
+    """Lowest integer score reaching each of RATING_PERCENTS of max_score, for bisecting a total into RATINGS."""
+    if not max_score:
+        return []
+    cuts = []
+    for pct in RATING_PERCENTS:
+        # Start from the exact bound and settle on the same float comparison the percentage used.
+        s = math.ceil(max_score * pct / 100)
+        while s > 0 and (s - 1) / max_score * 100 >= pct:
+            s -= 1
+        while s / max_score * 100 < pct:
+            s += 1
+        cuts.append(s)
+    return cuts
+
 class DrovalixScorer:
     def __init__(self, metrics: Optional[List[StockMetric]] = None):
         if metrics is None:
-            metrics = [
-                ROEMetric(),
-                ReturnOnAssetsMetric(),
-                ROICMetric(),
-                DebtToEquityMetric(),
-                CurrentRatioMetric(),
-                QuickRatioMetric(),
-                InterestCoverageMetric(),
-                ProfitMarginMetric(),
-                OperatingMarginMetric(),
-                FreeCashFlowMetric(),
-                PriceToFreeCashFlowMetric(),
-                RevenueGrowthMetric(),
-                FiveYearRevenueGrowthMetric(),
-                EPSGrowthMetric(),
-                DividendGrowthMetric(),
-                PERatioMetric(),
-                PEGMetric(),
-                PBMetric(),
-                PriceToSalesMetric(),
-                GrahamNumberMetric(),
-                DividendMetric(),
-                PayoutRatioMetric(),
-                ShortFloatMetric(),
-                AnalystRecommendationMetric(),
-                InsiderOwnershipMetric(),
-                InstitutionalOwnershipMetric(),
-                ESGScoreMetric(),
-                AltmanZScoreMetric(),
-                MarketCapMetric(),
-                AvgVolumeMetric(),
-                BetaMetric(),
-                PriceMomentumMetric(),
-                CompanyAgeMetric(),
-            ]
+            metrics = list(DEFAULT_METRICS)
         self.metrics = metrics
+        self.compile()
+
+    @property
+    def result_dtype(self) -> np.dtype:
+        """
+        One row per ticker: identity, totals, then one int16 points column per metric.
+        Built on use so metric names only have to be unique for the array paths.
+        """
+        columns = [("symbol", "U16"), ("score", "i4"), ("max_score", "i4"), ("rating", "U9")]
+        columns += [(field, "O") for field in RESULT_INFO_FIELDS]
+        taken = {name for name, _ in columns}
+        clashes = []
+        for metric in self.metrics:
+            if metric.name in taken:
+                clashes.append(metric.name)
+            taken.add(metric.name)
+        if clashes:
+            raise ValueError("Metric names must be unique and not reuse a result field for array "
+                             "results; clashing: %s" % ", ".join(clashes))
+        return np.dtype(columns + [(metric.name, "i2") for metric in self.metrics])
+
+    def compile(self):
+        """
+        Generate a single straight-line scoring function for the current metric set.
+        Each metric's bound score() becomes a local of the generated function and its
+        values tuple is built inline from its keys, so scoring a ticker runs without the
+        per-metric loop and attribute lookups. Metrics with all_keys_required skip score()
+        when a value is missing and reuse their all-None result, computed once here.
+        It returns the total, the flat reasons list and the per-metric breakdown of
+        MetricResult records, built as sized list displays rather than grown with
+        append/extend per metric.
+        A points-only twin (_points) is generated alongside for ranking; it inlines the
+        threshold lookup of vectorizable metrics so no reason strings are formatted.
+        Everything derived from the metric set (max_score, rating cuts, required keys,
+        quoteSummary modules, cache key) is recomputed here and the fetched-result memo
+        is cleared, so call again after changing self.metrics.
+        """
         self.max_score = sum(metric.max_points for metric in self.metrics)
+        self.rating_cuts = rating_cuts(self.max_score)
+        # symbol is supplied by the engine rather than fetched.
+        self.required_keys = frozenset(k for metric in self.metrics for k in metric.required_keys()) - {"symbol"}
+        fields = self.required_keys.union(RESULT_INFO_FIELDS)
+        unmapped = sorted(fields - QUOTE_SUMMARY_FIELD_MODULES.keys() - UNPUBLISHED_INFO_FIELDS)
+        if unmapped:
+            # A direct fetch would silently lack these, so batches go through yfinance's .info.
+            logger.warning("No quoteSummary module serves %s; fetching through yfinance", ", ".join(unmapped))
+        self.quote_modules = None if unmapped else quote_summary_modules(fields)
+        # Results of _score_fetched for _fetched_date (UTC), by ticker.
+        self._fetched: Dict[str, Dict[str, Any]] = {}
+        self._fetched_date = 0
+        count = len(self.metrics)
+        total = " + ".join(f"p{i}" for i in range(count)) or "0"
+        reasons = "".join(f"*r{i}, " for i in range(count))
+        breakdown = "".join(
+            f"MetricResult({metric.name!r}, p{i}, {metric.max_points!r}, r{i}), "
+            for i, metric in enumerate(self.metrics)
+        )
+        points = "".join(f"p{i}, " for i in range(count))
+        namespace: Dict[str, Any] = {"MetricResult": MetricResult}
+        source = ["def _scored(info, symbol):", "    get = info.get"]
+        points_source = ["def _points(info, symbol):", "    get = info.get"]
+        for i, metric in enumerate(self.metrics):
+            namespace[f"s{i}"] = metric.score
+            # symbol comes from the caller so the shared info dict is never written to.
+            values = "".join("symbol, " if key == "symbol" else f"get({key!r}), " for key in metric.keys)
+            if metric.all_keys_required and metric.keys:
+                namespace[f"mp{i}"], namespace[f"mr{i}"] = metric.score((None,) * len(metric.keys))
+                source.append(f"    v{i} = ({values})")
+                source.append(f"    p{i}, r{i} = (mp{i}, list(mr{i})) if None in v{i} else s{i}(v{i})")
+            else:
+                source.append(f"    p{i}, r{i} = s{i}(({values}))")
+            if metric.vectorizable:
+                table = metric.thresholds
+                namespace[f"c{i}"], namespace[f"f{i}"] = table.cutoffs, table.find
+                namespace[f"b{i}"] = tuple(bucket[0] for bucket in table.buckets)
+                missing = f"v{i} is None or not v{i} > 0" if metric.positive_only else f"v{i} is None"
+                scaled = f"v{i} * {table.scale!r}" if table.scale != 1 else f"v{i}"
+                points_source += [
+                    f"    v{i} = {values[:-2]}",
+                    f"    if {missing}:",
+                    f"        p{i} = 0",
+                    "    else:",
+                    f"        x = {scaled}",
+                    f"        p{i} = b{i}[f{i}(c{i}, x) if x == x else {table.nan_bucket}]",
+                ]
+            elif metric.all_keys_required and metric.keys:
+                points_source.append(f"    v{i} = ({values})")
+                points_source.append(f"    p{i} = mp{i} if None in v{i} else s{i}(v{i})[0]")
+            else:
+                points_source.append(f"    p{i} = s{i}(({values}))[0]")
+        source.append(f"    return {total}, [{reasons}], [{breakdown}]")
+        points_source.append(f"    return {total}, ({points})")
+        exec("\n".join(source), namespace)
+        exec("\n".join(points_source), namespace)
+        self._scored = namespace["_scored"]
+        self._points = namespace["_points"]
+        # Identifies the metric set (fields and thresholds) in the on-disk score cache.
+        self.metrics_key = hashlib.sha1(repr([
+            (type(metric).__qualname__, metric, metric.keys, metric.thresholds)
+            for metric in self.metrics
+        ]).encode("utf-8")).hexdigest()
+        return self._scored
 
     def get_rating(self, score: int) -> str:
-        pct = (score / self.max_score) * 100 if self.max_score else 0
-        if pct >= 85:
-            return "Excellent"
-        elif pct >= 70:
-            return "Very Good"
-        elif pct >= 55:
-            return "Good"
-        elif pct >= 40:
-            return "Average"
-        else:
-            return "Weak"
+        return RATINGS[bisect.bisect_right(self.rating_cuts, score)]
 
-    def score_stock(self, ticker: str, info: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        logger.info(f"Scoring ticker: {ticker}")
+    def score_stock(self, ticker: str, info: Optional[Dict[str, Any]] = None,
+                    timestamp: Optional[str] = None) -> Dict[str, Any]:
+        """Score one ticker, fetching its info unless given; timestamp lets a batch share one run time."""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Scoring ticker: %s", ticker)
         try:
-            stock = yf.Ticker(ticker)
             if info is None:
-                info = stock.info
-            info['symbol'] = ticker  # for technical and price metrics
-            total_score = 0
-            reasons: List[str] = []
-            metric_breakdown: List[Dict[str, Any]] = []
-            for metric in self.metrics:
-                pts, rsn = metric.score(info)
-                total_score += pts
-                reasons.extend(rsn)
-                metric_breakdown.append({
-                    "metric": metric.name,
-                    "score": pts,
-                    "max": metric.max_points,
-                    "explanation": rsn,
-                })
-            result = {
-                "symbol": ticker,
-                "score": total_score,
-                "max_score": self.max_score,
-                "rating": self.get_rating(total_score),
-                "reasons": reasons,
-                "metrics": metric_breakdown,
-                "sector": info.get("sector"),
-                "industry": info.get("industry"),
-                "shortName": info.get("shortName"),
-                "timestamp": datetime.utcnow().isoformat() + "Z"
-            }
-            logger.debug(f"Score result for {ticker}: {result}")
-            return result
+                result = self._score_fetched(ticker, _utc_date())
+                # The memoized result is shared, so a batch's timestamp goes on a copy.
+                return result if timestamp is None else {**result, "timestamp": timestamp}
+            return self._score_info(ticker, info, timestamp)
         except Exception as e:
-            logger.error(f"Error scoring {ticker}: {e}")
+            logger.error("Error scoring %s: %s", ticker, e)
             return {
                 "symbol": ticker,
                 "error": str(e),
@@ -985,21 +1648,253 @@ class DrovalixScorer:
                 "rating": "Error",
                 "reasons": ["Failed to retrieve or process data"],
                 "metrics": [],
-                "timestamp": datetime.utcnow().isoformat() + "Z"
+                "timestamp": timestamp or _utc_timestamp()
             }
 
-    def score_batch(self, tickers: List[str], parallel: bool = True, max_workers: int = 6) -> List[Dict[str, Any]]:
-        if parallel and len(tickers) > 1:
-            results = []
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_ticker = {executor.submit(self.score_stock, t): t for t in tickers}
-                for future in concurrent.futures.as_completed(future_to_ticker):
-                    res = future.result()
-                    results.append(res)
-            results.sort(key=lambda r: tickers.index(r["symbol"]) if r.get("symbol") in tickers else 9999)
-            return results
+    def score_points(self, ticker: str, info: Dict[str, Any]) -> Tuple[int, Tuple[int, ...]]:
+        """Total and per-metric points (in self.metrics order) without building reason strings, for ranking."""
+        return self._points(info, ticker)
+
+    def _score_fetched(self, ticker: str, date: int) -> Dict[str, Any]:
+        # A ticker is fetched and scored at most once per UTC day per scorer, and once per day
+        # per metric set across runs via the on-disk score cache. The memo only holds one day.
+        if date != self._fetched_date:
+            self._fetched = {}
+            self._fetched_date = date
+        result = self._fetched.get(ticker)
+        if result is None:
+            result = read_cached_score(ticker, date, self.metrics_key)
+            if result is None:
+                result = self._score_info(ticker, load_info(ticker, self.required_keys))
+                write_cached_score(ticker, date, self.metrics_key, result)
+            self._fetched[ticker] = result
+        return result
+
+    def _score_info(self, ticker: str, info: Dict[str, Any], timestamp: Optional[str] = None) -> Dict[str, Any]:
+        if logger.isEnabledFor(logging.DEBUG):
+            missing = sorted(k for k in self.required_keys if info.get(k) is None)
+            logger.debug("%s: %d/%d info fields missing: %s", ticker, len(missing), len(self.required_keys), ", ".join(missing))
+        total_score, reasons, metric_breakdown = self._scored(info, ticker)
+        result = {
+            "symbol": ticker,
+            "score": total_score,
+            "max_score": self.max_score,
+            "rating": self.get_rating(total_score),
+            "reasons": reasons,
+            "metrics": metric_breakdown,
+            **{field: info.get(field) for field in RESULT_INFO_FIELDS},
+            "timestamp": timestamp or _utc_timestamp()
+        }
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Score result for %s: %s", ticker, result)
+        return result
+
+    def iter_batch(self, tickers: List[str], parallel: bool = True, max_workers: int = 6,
+                   max_inflight: int = CONCURRENCY_LIMIT, shards: int = 1) -> Iterator[Dict[str, Any]]:
+        """
+        Yield each ticker's result as soon as it is scored (completion order when parallel):
+        cached infos first, then each direct fetch as it lands, then the yfinance fallbacks.
+        shards > 1 scores the fetched infos on that many processes once all have landed;
+        scoring is cheap next to pickling an info dict and its result, so only large, slow
+        metric sets gain from it.
+        """
+        if any(metric.uses_price_history for metric in self.metrics):
+            prefetch_history(tickers)
+        if len(tickers) > 1:
+            missing: List[str] = []
+
+            def ready() -> Iterator[Tuple[str, Dict[str, Any]]]:
+                for t, info in self._iter_infos(tickers, parallel, max_inflight):
+                    if info is None:
+                        missing.append(t)
+                    else:
+                        yield t, info
+
+            # Every result of the batch, yfinance fallbacks and errors included, shares one run timestamp.
+            timestamp = _utc_timestamp()
+            processes = min(shards, len(tickers))
+            if processes > 1:
+                yield from self._score_in_processes(list(ready()), processes, timestamp)
+            else:
+                for t, info in ready():
+                    yield self.score_stock(t, info=info, timestamp=timestamp)
+            if missing and parallel:
+                # Tickers with no info yet go through yfinance on a thread pool (I/O bound).
+                with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    future_to_ticker = {executor.submit(self.score_stock, t, None, timestamp): t for t in missing}
+                    for future in concurrent.futures.as_completed(future_to_ticker):
+                        yield future.result()
+            else:
+                for t in missing:
+                    yield self.score_stock(t, timestamp=timestamp)
         else:
-            return [self.score_stock(ticker) for ticker in tickers]
+            for ticker in tickers:
+                yield self.score_stock(ticker)
+
+    def _iter_infos(self, tickers: List[str], parallel: bool,
+                    max_inflight: int = CONCURRENCY_LIMIT) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Stage 1 of a batch: (ticker, info) for every ticker, from the disk cache first and then
+        from the direct quoteSummary fetch as each response lands. info is None for tickers
+        neither could serve (left for yfinance). Without quote_modules only full yfinance
+        infos cached earlier are used.
+        """
+        modules = self.quote_modules
+        cached = [(t, read_cached_info(t, modules)) for t in tickers]
+        pending = [t for t, info in cached if info is None] if modules is not None else []
+        # Requests go out before the cached infos are handed on for scoring.
+        fetches = iter_info_batch(pending, modules=modules,
+                                  concurrency=max(1, max_inflight) if parallel else 1)
+        for t, info in cached:
+            if info is not None or modules is None:
+                yield t, info
+        for t, info in fetches:
+            if info is not None:
+                write_cached_info(t, info, modules)
+            yield t, info
+
+    def _gather_infos(self, tickers: List[str], parallel: bool,
+                      max_inflight: int = CONCURRENCY_LIMIT) -> Tuple[List[Tuple[str, Dict[str, Any]]], List[str]]:
+        """All of _iter_infos at once: the (ticker, info) pairs served, and the tickers left for yfinance."""
+        ready = []
+        missing = []
+        for t, info in self._iter_infos(tickers, parallel, max_inflight):
+            if info is None:
+                missing.append(t)
+            else:
+                ready.append((t, info))
+        return ready, missing
+
+    def _score_in_processes(self, items: List[Tuple[str, Dict[str, Any]]], max_workers: int,
+                            timestamp: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Score already-fetched (ticker, info) pairs on a process pool, in input order."""
+        history: Dict[Tuple[str, int], np.ndarray] = {}
+        if any(metric.uses_price_history for metric in self.metrics):
+            symbols = {t for t, _ in items}
+            history = {key: closes for key, closes in _PRICE_CACHE.items() if key[0] in symbols}
+        chunksize = max(1, min(64, len(items) // (max_workers * 4)))
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_score_worker,
+            initargs=(tuple(self.metrics), history),
+        ) as executor:
+            yield from executor.map(functools.partial(_score_one, timestamp=timestamp), items, chunksize=chunksize)
+
+    def score_batch(self, tickers: List[str], parallel: bool = True, max_workers: int = 6,
+                    max_inflight: int = CONCURRENCY_LIMIT, shards: int = 1) -> List[Dict[str, Any]]:
+        results = list(self.iter_batch(tickers, parallel=parallel, max_workers=max_workers,
+                                       max_inflight=max_inflight, shards=shards))
+        # Input position of each ticker (first occurrence), for an O(N log N) reorder.
+        order: Dict[str, int] = {}
+        for i, t in enumerate(tickers):
+            order.setdefault(t, i)
+        results.sort(key=lambda r: order.get(r.get("symbol"), len(tickers)))
+        return results
+
+    def results_to_array(self, results: List[Dict[str, Any]]) -> np.ndarray:
+        """Pack scored results into a structured array (one column per field and per metric)."""
+        arr = np.zeros(len(results), dtype=self.result_dtype)
+        for i, res in enumerate(results):
+            row = arr[i]
+            row["symbol"] = res.get("symbol", "")
+            row["score"] = res.get("score", 0)
+            row["max_score"] = res.get("max_score", self.max_score)
+            row["rating"] = res.get("rating", "")
+            for field in RESULT_INFO_FIELDS:
+                row[field] = res.get(field)
+            for m in res.get("metrics", []):
+                row[m.metric] = m.score
+        return arr
+
+    def score_batch_array(self, tickers: List[str], parallel: bool = True, max_workers: int = 6,
+                          max_inflight: int = CONCURRENCY_LIMIT) -> np.ndarray:
+        """Score tickers column-wise and return the compact structured-array form, in input order."""
+        if any(metric.uses_price_history for metric in self.metrics):
+            prefetch_history(tickers)
+        ready, missing = self._gather_infos(tickers, parallel, max_inflight)
+        infos: Dict[str, Optional[Dict[str, Any]]] = dict(ready)
+        if missing:
+            def load(ticker):
+                try:
+                    return load_info(ticker, self.required_keys)
+                except Exception as e:
+                    logger.error("Error scoring %s: %s", ticker, e)
+                    return None
+            if parallel:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    infos.update(zip(missing, executor.map(load, missing)))
+            else:
+                infos.update((t, load(t)) for t in missing)
+        return self.score_infos_array(tickers, [infos.get(t) for t in tickers])
+
+    def score_infos_array(self, tickers: List[str], infos: List[Optional[Dict[str, Any]]]) -> np.ndarray:
+        """
+        Score already-fetched info dicts a metric at a time over whole columns, rather than a
+        ticker at a time. Rows whose info is None, or that fail to score, come back as errors
+        (score 0, rating "Error"), as in results_to_array().
+        """
+        size = len(tickers)
+        arr = np.zeros(size, dtype=self.result_dtype)
+        arr["symbol"] = tickers
+        arr["max_score"] = self.max_score
+        failed = np.fromiter((info is None for info in infos), dtype=bool, count=size)
+        # Read every field a ticker needs in one pass over its info, then transpose the records
+        # into one object column per key (structure of arrays) for the metrics to walk.
+        keys = tuple(self.required_keys.union(RESULT_INFO_FIELDS))
+        records = [tuple(map(({} if info is None else info).get, keys)) for info in infos]
+        transposed = zip(*records) if records else [()] * len(keys)
+        columns = {key: np.fromiter(column, dtype=object, count=size) for key, column in zip(keys, transposed)}
+        columns["symbol"] = np.array(tickers, dtype=object)
+        total = np.zeros(size, dtype=np.int32)
+        for metric in self.metrics:
+            cols = tuple(columns[key] for key in metric.keys)
+            try:
+                points = metric.score_vec(cols, size)
+            except Exception:
+                # Find the offending rows so only they are reported as errors.
+                points = np.zeros(size, dtype=np.int16)
+                for i, values in enumerate(zip(*cols)):
+                    try:
+                        points[i] = metric.score(values)[0]
+                    except Exception:
+                        failed[i] = True
+            arr[metric.name] = points
+            total += points
+        for field in RESULT_INFO_FIELDS:
+            arr[field] = columns[field]
+        arr["rating"] = np.array(RATINGS)[np.searchsorted(self.rating_cuts, total, side="right")]
+        arr["score"] = total
+        if failed.any():
+            arr["score"][failed] = 0
+            arr["rating"][failed] = "Error"
+            for metric in self.metrics:
+                arr[metric.name][failed] = 0
+            for field in RESULT_INFO_FIELDS:
+                arr[field][failed] = None
+        return arr
+
+    def vectorized_mismatches(self, tickers: List[str],
+                              infos: List[Optional[Dict[str, Any]]]) -> List[Tuple[str, str, Any, Any]]:
+        """
+        (ticker, column, per-ticker value, score_infos_array value) wherever the column kernels
+        disagree with scoring each info on its own; empty when they match. Run it over edge-case
+        infos (None, NaN, ±inf, zero, text) after changing a score_vec.
+        """
+        arr = self.score_infos_array(tickers, infos)
+        mismatches = []
+        for row, ticker, info in zip(arr, tickers, infos):
+            try:
+                if info is None:
+                    raise ValueError("no info")
+                res = self._score_info(ticker, info)
+                expected = {"rating": res["rating"], "score": res["score"]}
+                expected.update((m.metric, m.score) for m in res["metrics"])
+            except Exception:
+                expected = {"rating": "Error", "score": 0}
+                expected.update((metric.name, 0) for metric in self.metrics)
+            mismatches.extend((ticker, column, value, row[column].item())
+                              for column, value in expected.items() if row[column] != value)
+        return mismatches
 
     def explain_metrics(self) -> str:
         tbl = [["Metric", "Description", "Max Points"]]
@@ -1007,6 +1902,22 @@ class DrovalixScorer:
             tbl.append([m.name, m.description, m.max_points])
         return tbl
 
+# =========================
+# Process Pool Workers
+# =========================
+
+# Scorer built once per worker process by _init_score_worker.
+_WORKER_SCORER: Optional[DrovalixScorer] = None
+
+def _init_score_worker(metrics: Tuple[StockMetric, ...], history: Dict[Tuple[str, int], np.ndarray]):
+    global _WORKER_SCORER
+    _PRICE_CACHE.update(history)
+    _WORKER_SCORER = DrovalixScorer(list(metrics))
+
+def _score_one(item: Tuple[str, Dict[str, Any]], timestamp: Optional[str] = None) -> Dict[str, Any]:
+    ticker, info = item
+    return _WORKER_SCORER.score_stock(ticker, info=info, timestamp=timestamp)
+
 # =========================
 # CLI and I/O Utilities
 # =========================
@@ -1035,6 +1946,14 @@ def parse_args():
         "--json", action="store_true",
         help="Force JSON output (default: JSON)"
     )
+    parser.add_argument(
+        "--pretty", action="store_true",
+        help="Indent JSON output and keep input order (default: compact, streamed as scored)"
+    )
+    parser.add_argument(
+        "--ndjson", action="store_true",
+        help="Write one JSON record per line, flushed as each ticker is scored (implied by .ndjson/.jsonl output)"
+    )
     parser.add_argument(
         "--md", "--markdown", dest="markdown", action="store_true",
         help="Output in Markdown table format"
@@ -1043,6 +1962,10 @@ def parse_args():
         "-v", "--verbose", action="store_true",
         help="Enable detailed logging"
     )
+    parser.add_argument(
+        "--debug", action="store_true",
+        help="Enable debug logging, including full per-ticker results"
+    )
     parser.add_argument(
         "--metrics", action="store_true",
         help="Show detailed metric breakdown for each stock"
@@ -1051,74 +1974,175 @@ def parse_args():
         "--explain-metrics", action="store_true",
         help="Show metric descriptions and exit"
     )
+    parser.add_argument(
+        "--table", choices=["markdown", "pretty"], default="markdown",
+        help="Table style for --explain-metrics (pretty requires prettytable)"
+    )
     parser.add_argument(
         "--parallel", action="store_true",
         help="Batch score stocks in parallel (default: on for >2)"
     )
     parser.add_argument(
         "--max-workers", type=int, default=6,
-        help="Max workers for parallel scoring (default: 6)"
+        help="Threads for tickers fetched through yfinance when the direct fetch misses (default: 6); "
+             "see --shards for scoring processes"
+    )
+    parser.add_argument(
+        "--max-inflight", type=int, default=CONCURRENCY_LIMIT,
+        help=f"Max concurrent Yahoo requests when fetching a batch (default: {CONCURRENCY_LIMIT})"
+    )
+    parser.add_argument(
+        "--shards", type=int, default=1,
+        help="Worker processes for scoring fetched/cached infos (default: 1, in-process)"
+    )
+    parser.add_argument(
+        "--cache-ttl", type=float, default=INFO_CACHE_TTL,
+        help=f"Seconds cached info downloads and scores stay fresh (default: {INFO_CACHE_TTL})"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help=f"Ignore and do not update the on-disk caches in {CACHE_DIR}"
+    )
+    parser.add_argument(
+        "--clear-cache", action="store_true",
+        help="Delete the cached downloads and scores before scoring"
     )
     return parser.parse_args()
 
+def use_uring_event_loop() -> bool:
+    """Install the io_uring asyncio loop policy on Linux 5.11+ when uringcore is available."""
+    if uringcore is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        major, minor = (int(part) for part in platform.release().split("-")[0].split(".")[:2])
+    except ValueError:
+        return False
+    if (major, minor) < (5, 11):
+        return False
+    asyncio.set_event_loop_policy(uringcore.EventLoopPolicy())
+    logger.debug("Using uringcore event loop policy")
+    return True
+
 def load_tickers_from_file(filepath: str) -> List[str]:
-    tickers = []
+    tickers: List[str] = []
     try:
         with open(filepath, "r") as f:
-            reader = csv.reader(f)
-            for row in reader:
-                if row:
-                    tickers.append(row[0].strip())
-        logger.info(f"Loaded {len(tickers)} tickers from {filepath}")
+            tickers = [row[0].strip() for row in csv.reader(f) if row]
+        logger.info("Loaded %d tickers from %s", len(tickers), filepath)
     except Exception as e:
-        logger.error(f"Failed to load tickers from file {filepath}: {e}")
+        logger.error("Failed to load tickers from file %s: %s", filepath, e)
     return tickers
 
-def save_results(results: List[Dict[str, Any]], output_file: str, as_csv: bool = False, as_md: bool = False, show_metrics: bool = False):
+def dumps_results(results: List[Dict[str, Any]]) -> bytes:
+    """Serialize results as indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson:
+        return orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(results, indent=2, default=_json_default).encode("utf-8")
+
+def _dumps_record(res: Dict[str, Any]) -> bytes:
+    if orjson:
+        return orjson.dumps(res, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(res, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+def write_results_json(results: Iterable[Dict[str, Any]], f, pretty: bool = False) -> None:
+    """
+    Write results to a binary file as a JSON array, one compact record at a time so a streamed
+    batch never has to be held in memory. pretty renders the whole list indented instead.
+    """
+    if pretty:
+        f.write(dumps_results(list(results)))
+        return
+    f.write(b"[")
+    for i, res in enumerate(results):
+        if i:
+            f.write(b",")
+        f.write(_dumps_record(res))
+    f.write(b"]\n")
+
+def write_results_ndjson(results: Iterable[Dict[str, Any]], f) -> None:
+    """Write one compact JSON record per line to a binary file, flushing each so readers see it at once."""
+    for res in results:
+        f.write(_dumps_record(res) + b"\n")
+        f.flush()
+
+def _csv_row(res: Dict[str, Any], keys: List[str]) -> List[Any]:
+    row = []
+    for k in keys:
+        value = res.get(k, "")
+        if k == "reasons" and isinstance(value, list):
+            value = '; '.join(value)
+        elif k == "metrics" and isinstance(value, list):
+            value = '; '.join(f"{m.metric}={m.score}/{m.max}" for m in value)
+        row.append(value)
+    return row
+
+def write_results_csv(results: Iterable[Dict[str, Any]], f, keys: List[str]) -> None:
+    """
+    Write results as CSV rows one at a time, so a streamed batch never has to be held in memory.
+    Each row is flushed before waiting on the next result, so readers see it as soon as it is scored.
+    """
+    writer = csv.writer(f, dialect="unix", quoting=csv.QUOTE_MINIMAL)
+    writer.writerow(keys)
+
+    def rows() -> Iterator[List[Any]]:
+        for res in results:
+            yield _csv_row(res, keys)
+            # writerows has written the row by the time it asks for the next one.
+            f.flush()
+
+    writer.writerows(rows())
+
+def save_results(results: Iterable[Dict[str, Any]], output_file: str, as_csv: bool = False, as_md: bool = False,
+                 show_metrics: bool = False, pretty: bool = False, as_ndjson: bool = False):
     try:
         if as_csv or output_file.endswith(".csv"):
             keys = ['symbol', 'score', 'max_score', 'rating', 'reasons', 'sector', 'industry', 'shortName']
             if show_metrics:
                 keys.append("metrics")
             with open(output_file, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=keys)
-                writer.writeheader()
-                for res in results:
-                    row = {k: res.get(k, "") for k in keys}
-                    if isinstance(row['reasons'], list):
-                        row['reasons'] = '; '.join(row['reasons'])
-                    if show_metrics and isinstance(row.get('metrics'), list):
-                        row['metrics'] = '; '.join(
-                            [f"{m['metric']}={m['score']}/{m['max']}" for m in row['metrics']]
-                        )
-                    writer.writerow(row)
-            logger.info(f"Results saved to {output_file} (CSV)")
+                write_results_csv(results, f, keys)
+            logger.info("Results saved to %s (CSV)", output_file)
+        elif as_ndjson or output_file.endswith((".ndjson", ".jsonl")):
+            with open(output_file, "wb") as f:
+                write_results_ndjson(results, f)
+            logger.info("Results saved to %s (NDJSON)", output_file)
         elif as_md or output_file.endswith(".md"):
-            save_results_md(results, output_file, show_metrics=show_metrics)
+            save_results_md(list(results), output_file, show_metrics=show_metrics)
         else:
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(results, f, indent=2)
-            logger.info(f"Results saved to {output_file} (JSON)")
+            with open(output_file, "wb") as f:
+                write_results_json(results, f, pretty=pretty)
+            logger.info("Results saved to %s (JSON)", output_file)
     except Exception as e:
-        logger.error(f"Failed to save results: {e}")
+        logger.error("Failed to save results: %s", e)
 
 def save_results_md(results: List[Dict[str, Any]], output_file: str, show_metrics: bool = False):
     try:
         with open(output_file, "w", encoding="utf-8") as f:
             f.write(results_md_table(results, show_metrics=show_metrics))
-        logger.info(f"Results saved to {output_file} (Markdown)")
+        logger.info("Results saved to %s (Markdown)", output_file)
     except Exception as e:
-        logger.error(f"Failed to save markdown: {e}")
+        logger.error("Failed to save markdown: %s", e)
+
+def format_table(header: List[str], rows: List[List[Any]]) -> str:
+    """Render an aligned Markdown table; column widths are computed once, then each line is one join."""
+    width = len(header)
+    if any(len(row) > width for row in rows):
+        raise ValueError("table row has more cells than the %d-column header" % width)
+    cells = [[str(x) for x in header]] + [[str(x) for x in row] + [""] * (width - len(row)) for row in rows]
+    widths = [max(3, *map(len, column)) for column in zip(*cells)]
+    lines = ["| " + " | ".join(cell.ljust(w) for cell, w in zip(row, widths)) + " |" for row in cells]
+    separator = "| " + " | ".join("-" * w for w in widths) + " |"
+    return "\n".join([lines[0], separator] + lines[1:])
 
 def results_md_table(results: List[Dict[str, Any]], show_metrics: bool = False) -> str:
     if not results:
         return "No results."
     cols = ['Symbol', 'Score', 'Max', 'Rating', 'Sector', 'Industry', 'ShortName']
     if show_metrics:
-        metric_names = [m['metric'] for m in results[0].get('metrics', [])]
+        # Error results carry no metrics, so take the names from the first one that does.
+        scored = next((res['metrics'] for res in results if res.get('metrics')), [])
+        metric_names = [m.metric for m in scored]
         cols += metric_names
-    header = '| ' + ' | '.join(cols) + ' |\n'
-    header += '| ' + ' | '.join(['---'] * len(cols)) + ' |\n'
     rows = []
     for res in results:
         base = [
@@ -1131,81 +2155,87 @@ def results_md_table(results: List[Dict[str, Any]], show_metrics: bool = False)
             res.get('shortName', ''),
         ]
         if show_metrics and res.get('metrics'):
-            base += [f"{m['score']}/{m['max']}" for m in res['metrics']]
-        rows.append('| ' + ' | '.join(str(x) for x in base) + ' |')
-    return header + '\n'.join(rows)
+            base += [f"{m.score}/{m.max}" for m in res['metrics']]
+        rows.append(base)
+    return format_table(cols, rows)
 
-def print_results(results: List[Dict[str, Any]], as_csv: bool = False, as_md: bool = False, show_metrics: bool = False):
+def print_results(results: Iterable[Dict[str, Any]], as_csv: bool = False, as_md: bool = False,
+                  show_metrics: bool = False, pretty: bool = False, as_ndjson: bool = False):
     if as_csv:
         keys = ['symbol', 'score', 'max_score', 'rating', 'sector', 'industry', 'shortName', 'reasons']
         if show_metrics:
             keys.append("metrics")
-        writer = csv.DictWriter(sys.stdout, fieldnames=keys)
-        writer.writeheader()
-        for res in results:
-            row = {k: res.get(k, "") for k in keys}
-            if isinstance(row['reasons'], list):
-                row['reasons'] = '; '.join(row['reasons'])
-            if show_metrics and isinstance(row.get('metrics'), list):
-                row['metrics'] = '; '.join(
-                    [f"{m['metric']}={m['score']}/{m['max']}" for m in row['metrics']]
-                )
-            writer.writerow(row)
-    elif as_md and PrettyTable:
-        print(results_md_table(results, show_metrics=show_metrics))
+        write_results_csv(results, sys.stdout, keys)
+    elif as_ndjson:
+        sys.stdout.flush()
+        write_results_ndjson(results, sys.stdout.buffer)
     elif as_md:
-        print(results_md_table(results, show_metrics=show_metrics))
+        print(results_md_table(list(results), show_metrics=show_metrics))
     else:
-        print(json.dumps(results, indent=2))
+        sys.stdout.flush()
+        write_results_json(results, sys.stdout.buffer, pretty=pretty)
+        sys.stdout.buffer.flush()
 
 # =========================
 # Main Entry Point
 # =========================
 
 def main():
+    global INFO_CACHE_TTL, DISK_CACHE
     args = parse_args()
-    if args.verbose:
+    if args.debug:
         logger.setLevel(logging.DEBUG)
+    elif args.verbose:
+        logger.setLevel(logging.INFO)
+    INFO_CACHE_TTL = args.cache_ttl
+    DISK_CACHE = not args.no_cache
+    if args.clear_cache:
+        clear_caches()
 
     scorer = DrovalixScorer()
 
     if args.explain_metrics:
         tbl = scorer.explain_metrics()
-        if PrettyTable:
+        if args.table == "pretty" and PrettyTable:
             pt = PrettyTable()
             pt.field_names = tbl[0]
             for row in tbl[1:]:
                 pt.add_row(row)
             print(pt)
         else:
-            print(results_md_table([{
-                "metrics": [
-                    {"metric": r[0], "score": r[2], "max": r[2], "explanation": r[1]}
-                    for r in tbl[1:]
-                ]
-            }], show_metrics=True))
+            print(format_table(tbl[0], tbl[1:]))
         sys.exit(0)
 
-    tickers: List[str] = []
-    if args.file:
-        tickers = load_tickers_from_file(args.file)
-    if args.tickers:
-        for t in args.tickers:
-            tickers.extend([tk.strip() for tk in t.split(',') if tk.strip()])
-    tickers = list(dict.fromkeys([t.upper() for t in tickers if t]))
+    raw: List[str] = load_tickers_from_file(args.file) if args.file else []
+    for t in args.tickers or ():
+        raw.extend(t.split(','))
+    # Normalize, drop blanks and dedupe (keeping first-seen order) in a single pass.
+    tickers = list(dict.fromkeys(filter(None, (t.strip().upper() for t in raw))))
     if not tickers:
         logger.warning("No tickers provided. Defaulting to INFY.NS")
         tickers = ["INFY.NS"]
 
     use_parallel = args.parallel or (len(tickers) > 2)
-    results = scorer.score_batch(tickers, parallel=use_parallel, max_workers=args.max_workers)
+    if use_parallel:
+        use_uring_event_loop()
+    as_csv = args.csv or bool(args.output and args.output.endswith(".csv") and not args.json)
+    as_ndjson = not as_csv and (args.ndjson or bool(args.output and args.output.endswith((".ndjson", ".jsonl"))))
+    as_md = not as_csv and not as_ndjson and (args.markdown or bool(args.output and args.output.endswith(".md")))
+    if as_md or (args.pretty and not as_csv and not as_ndjson):
+        # Markdown tables and --pretty JSON are rendered from the ordered batch.
+        results = scorer.score_batch(tickers, parallel=use_parallel, max_workers=args.max_workers,
+                                     max_inflight=args.max_inflight, shards=args.shards)
+    else:
+        # CSV rows and compact JSON / NDJSON records are written as each ticker finishes.
+        results = scorer.iter_batch(tickers, parallel=use_parallel, max_workers=args.max_workers,
+                                    max_inflight=args.max_inflight, shards=args.shards)
 
     if args.output:
-        save_as_csv = args.csv or (args.output.endswith(".csv") and not args.json)
-        save_as_md = args.markdown or args.output.endswith(".md")
-        save_results(results, args.output, as_csv=save_as_csv, as_md=save_as_md, show_metrics=args.metrics)
+        save_results(results, args.output, as_csv=as_csv, as_md=as_md, show_metrics=args.metrics,
+                     pretty=args.pretty, as_ndjson=as_ndjson)
     else:
-        print_results(results, as_csv=args.csv, as_md=args.markdown, show_metrics=args.metrics)
+        print_results(results, as_csv=args.csv, as_md=args.markdown and not as_ndjson, show_metrics=args.metrics,
+                      pretty=args.pretty, as_ndjson=as_ndjson)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file